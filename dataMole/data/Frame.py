@@ -45,9 +45,9 @@ def integerToFloat(df: pd.DataFrame) -> pd.DataFrame:
     integerCols = df.select_dtypes(include=int).columns.to_list()
     if not integerCols:
         return df
-    cdf = df.copy(True)
-    d = cdf[integerCols].astype(np.float)
-    cdf = cdf.drop(labels=integerCols, axis=1)
+    # Both selections already return new frames, so the input is not copied
+    d = df[integerCols].astype(np.float)
+    cdf = df.drop(labels=integerCols, axis=1)
     # Concat is much faster than subset assignment
     r = pd.concat([cdf, d], axis=1)
     r = r[df.columns.to_list()]
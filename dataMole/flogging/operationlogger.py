@@ -62,7 +62,8 @@ class GraphOperationLogger:
             self._stringsToLog.extend(['## RESULT INFO', logDataframeInfo(result)])
 
     def log(self, node: 'OperationNode', result: Optional[data.Frame], **kwargs) -> None:
-        if not isinstance(node.operation, Loggable):
+        if not isinstance(node.operation, Loggable) or not self._logHandle.isEnabledFor(logging.INFO):
+            # Nothing would be written, so skip building the log entry
             return None
         self._operationHeader(node)
         self._logOperationStuff(node.operation)
@@ -81,7 +82,8 @@ class OperationLogger(GraphOperationLogger):
             '# {:s} \nTimestamp: {}\n'.format(operation.name(), str(datetime.now())))
 
     def log(self, operation: 'Operation', result: Any, **kwargs) -> None:
-        if not isinstance(operation, Loggable):
+        if not isinstance(operation, Loggable) or not self._logHandle.isEnabledFor(logging.INFO):
+            # Nothing would be written, so skip building the log entry
             return None
         inputName: str = kwargs.get('input', None)
         outputName: str = kwargs.get('output', None)
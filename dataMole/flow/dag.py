@@ -21,7 +21,7 @@
 # You should have received a copy of the GNU General Public License
 # along with DataMole.  If not, see <https://www.gnu.org/licenses/>.
 
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 import networkx as nx
 
@@ -221,6 +221,11 @@ class OperationDag:
         """ Return the operation node with specified id """
         return self.__G.nodes[uid]['op']
 
+    def operations(self, uids: Iterable[int]) -> List[Tuple[int, 'GraphOperation']]:
+        """ Return the pairs (id, operation) for every node id in 'uids' """
+        nodes = self.__G.nodes
+        return [(uid, nodes[uid]['op'].operation) for uid in uids]
+
     def serialize(self) -> Dict:
         nodes: Dict[int, Dict] = dict()  # {id: node_data}
         for node_id in self.__G.nodes:
@@ -292,7 +297,7 @@ class OperationNode:
     def deserialize(state: Dict) -> 'OperationNode':
         node = OperationNode(None)
         node.operation = state['type']()
-        node.operation._shapes = [data.Shape.deserialize(s) if s else None for s in state['shapes']]
+        node.operation.shapes = [data.Shape.deserialize(s) if s else None for s in state['shapes']]
         node.__op_uid = state['uid']
         node.__inputs = [None] * node.operation.maxInputNumber()
         node.__input_order = state['order']
@@ -21,12 +21,15 @@
 # You should have received a copy of the GNU General Public License
 # along with DataMole.  If not, see <https://www.gnu.org/licenses/>.
 
+import functools
 import os
-from typing import List, Tuple
+from bisect import bisect_left
+from math import acos, degrees
+from typing import List, Tuple, Callable, Dict
 
 import numpy as np
 from PySide2.QtCharts import QtCharts
-from PySide2.QtCore import Qt, QPointF, QRectF, QRect, Slot, QSize, Signal
+from PySide2.QtCore import Qt, QPointF, QRectF, QRect, Slot, QSize, Signal, QTimer
 from PySide2.QtGui import QFont, QFontMetrics, QPainterPath, QColor, QKeyEvent, QWheelEvent, \
     QKeySequence, QMouseEvent, QCursor, QPixmap, QResizeEvent, QCloseEvent
 from PySide2.QtWidgets import QGraphicsSimpleTextItem, \
@@ -36,6 +39,173 @@ from dataMole import flogging
 from dataMole.gui.charts.utils import copyChart, computeAxisValue
 import pyqtgraph as pg
 
+# Zoom factors for the usual wheel deltas (multiples of 120, i.e. one wheel step)
+_ZOOM_FACTORS = {d: pow(1.25, d / 240.0) for d in range(-2400, 2401, 120)}
+
+
+# Maximum number of axis labels cached by every chart view
+_AXIS_TEXT_CACHE_SIZE = 4096
+
+
+def _calloutArrowTable(width: float, height: float) -> np.ndarray:
+    """
+    Build the table with the base points of the callout arrow, for every position of the anchor
+    relative to a callout rectangle of the given size (with top-left corner in the origin).
+
+    :return: array with shape (4, 4, 2, 4), indexed by the horizontal region of the anchor (left,
+        left of center, right of center, right), its vertical region (above, above center, below center,
+        below) and by a flag telling if the arrow is vertical. Last dimension holds (x1, y1, x2, y2)
+    """
+    r = np.arange(4)
+    h = r[:, None, None]
+    v = r[None, :, None]
+    vertical = np.array([False, True])[None, None, :]
+    onLeft, leftOfCenter, rightOfCenter, onRight = (h == 0), (h == 1), (h == 2), (h == 3)
+    above, aboveCenter, belowCenter, below = (v == 0), (v == 1), (v == 2), (v == 3)
+
+    x = (onRight | rightOfCenter) * width
+    y = (below | belowCenter) * height
+    cornerCase = (above | below) & (onLeft | onRight)
+    horizontalCorner = cornerCase & ~vertical
+    verticalCorner = cornerCase & vertical
+
+    x1 = x + leftOfCenter * 10 - rightOfCenter * 20 + horizontalCorner * (onLeft * 10 - onRight * 20)
+    y1 = y + aboveCenter * 10 - belowCenter * 20 + verticalCorner * (above * 10 - below * 20)
+    x2 = x + leftOfCenter * 20 - rightOfCenter * 10 + horizontalCorner * (onLeft * 20 - onRight * 10)
+    y2 = y + aboveCenter * 20 - belowCenter * 10 + verticalCorner * (above * 20 - below * 10)
+    return np.stack(np.broadcast_arrays(x1, y1, x2, y2), axis=-1).astype(float)
+
+
+def _labelsMetrics(axis: QtCharts.QAbstractAxis) -> QFontMetrics:
+    """ Return the font metrics of the axis labels. Metrics are kept in the axis object and rebuilt only
+    when the labels font changes """
+    font: QFont = axis.labelsFont()
+    fontKey: str = font.key()
+    if getattr(axis, '_dm_metricsFontKey', None) != fontKey:
+        axis._dm_metrics = QFontMetrics(font)
+        axis._dm_metricsFontKey = fontKey
+    return axis._dm_metrics
+
+
+def _resetMaxLabelWidth(axis: QtCharts.QAbstractAxis, *_) -> None:
+    axis._dm_maxLabelWidth = None
+
+
+def _maxLabelWidth(axis: QtCharts.QAbstractAxis) -> int:
+    """ Return the width in pixel of the widest label of a category axis. The value is cached in the
+    axis object and reset when its labels or their font change """
+    width: int = getattr(axis, '_dm_maxLabelWidth', None)
+    if width is None:
+        if axis.type() == QtCharts.QAbstractAxis.AxisTypeBarCategory:
+            labels: List[str] = axis.categories()
+        else:
+            labels: List[str] = axis.categoriesLabels()
+        metrics = _labelsMetrics(axis)
+        width = max(map(metrics.horizontalAdvance, labels), default=0)
+        if not hasattr(axis, '_dm_maxLabelWidth'):
+            # First computation: invalidate the cached value when the axis changes
+            reset = functools.partial(_resetMaxLabelWidth, axis)
+            axis.labelsFontChanged.connect(reset)
+            axis.categoriesChanged.connect(reset)
+        axis._dm_maxLabelWidth = width
+    return width
+
+
+def _availableLabelsSpace(chart: QtCharts.QChart, axis: QtCharts.QAbstractAxis, ticks: int,
+                          newSize: QSize) -> float:
+    """ Return the space available for displaying the labels of an axis, without margins and the space
+    between every label """
+    # Decide which dimension is relevant for resizing
+    margins = chart.margins()
+    left, top, right, bottom = chart.layout().getContentsMargins()
+    if axis.orientation() == Qt.Horizontal:
+        offset = margins.left() + margins.right() + (left or 0.0) + (right or 0.0)
+        return newSize.width() - offset - (ticks * 10)
+    else:
+        offset = margins.top() + margins.bottom() + (top or 0.0) + (bottom or 0.0)
+        return newSize.height() - offset - (ticks * 10)
+
+
+def _updateDateTimeTicks(axis: QtCharts.QDateTimeAxis, chart: QtCharts.QChart, newSize: QSize) -> None:
+    """ Sets the number of ticks of a datetime axis to the best value avoiding too many overlapping
+    labels """
+    ticks: int = axis.tickCount()  # current number of dates shown
+    label: str = axis.min().toString(axis.format())
+    if not label:
+        # No labels set
+        return
+    length = _availableLabelsSpace(chart, axis, ticks, newSize)
+    # Compute the optimal width of the label (in pixel)
+    metrics = _labelsMetrics(axis)
+    optimalWidth: float = metrics.horizontalAdvance(label) * 1.9  # not precise, 1.9 is to fix it
+    # Determine optimal number of ticks to avoid much overlapping
+    newTicks = int(length / optimalWidth) - 1
+    axis.setTickCount(newTicks)
+
+
+def _updateCategoryLabelsAngle(axis: QtCharts.QAbstractAxis, chart: QtCharts.QChart,
+                               newSize: QSize) -> None:
+    """ Rotates the labels of a category axis to avoid overlapping them """
+    ticks: int = axis.count()  # number of labels
+    optimalWidth: int = _maxLabelWidth(axis) if ticks else 0
+    if not optimalWidth:
+        # No labels set
+        return
+    length = _availableLabelsSpace(chart, axis, ticks, newSize)
+    labelSpace: float = length / (ticks * 2)
+    if labelSpace < optimalWidth:
+        deg = min(90.0, degrees(acos(labelSpace / optimalWidth)) * 1.1)
+        axis.setLabelsAngle(deg)
+    else:
+        axis.setLabelsAngle(0)
+
+
+def _noTickUpdate(chart: QtCharts.QChart, newSize: QSize) -> None:
+    """ Used for axis types which don't need to be updated """
+    pass
+
+
+def _tickUpdater(axis: QtCharts.QAbstractAxis) -> Callable[[QtCharts.QChart, QSize], None]:
+    """ Given an axis, return the function that updates its ticks and labels when the view is resized,
+    specialized for the axis type """
+    if not axis:
+        return _noTickUpdate
+    axisType = axis.type()
+    if axisType == QtCharts.QAbstractAxis.AxisTypeDateTime:
+        return functools.partial(_updateDateTimeTicks, axis)
+    elif axisType == QtCharts.QAbstractAxis.AxisTypeCategory or \
+            axisType == QtCharts.QAbstractAxis.AxisTypeBarCategory:
+        return functools.partial(_updateCategoryLabelsAngle, axis)
+    return _noTickUpdate  # Axis type not supported
+
+
+def _calloutArrow(table: List, xEdges: Tuple[float, float, float], yEdges: Tuple[float, float, float],
+                  ax: float, ay: float) -> Tuple[float, float, float, float]:
+    """
+    Return the base points of the callout arrow pointing to the anchor (ax, ay).
+
+    :param table: arrow table built with '_calloutArrowTable', as nested lists
+    :param xEdges: left, center and right coordinates of the callout rectangle
+    :param yEdges: top, center and bottom coordinates of the callout rectangle
+    :return: the tuple (x1, y1, x2, y2)
+    """
+    # establish the position of the anchor point in relation to the rectangle
+    hRegion: int = bisect_left(xEdges, ax)
+    vRegion: int = bisect_left(yEdges, ay)
+    # get the nearest rectangle corner
+    x = xEdges[2] if hRegion >= 2 else xEdges[0]
+    y = yEdges[2] if vRegion >= 2 else yEdges[0]
+    vertical = abs(ax - x) > abs(ay - y)
+    return tuple(table[hRegion][vRegion][vertical])
+
+
+@functools.lru_cache(maxsize=None)
+def _calloutFont() -> Tuple[QFont, QFontMetrics]:
+    """ Font and metrics shared by every callout. They are created on first use, since fonts need a
+    running QApplication """
+    font = QFont()
+    return font, QFontMetrics(font)
+
 
 class Callout(QGraphicsItem):
     def __init__(self, chart):
@@ -44,63 +214,81 @@ class Callout(QGraphicsItem):
         self._text = ""
         self._textRect = QRectF()
         self._anchor = QPointF()
-        self._font = QFont()
+        self._font, self._metrics = _calloutFont()
         self._rect = QRectF()
+        # Lookup tables for the arrow position, updated when the _rect changes
+        self._xEdges: Tuple[float, float, float] = (0, 0, 0)
+        self._yEdges: Tuple[float, float, float] = (0, 0, 0)
+        self._arrowTable: List = _calloutArrowTable(0, 0).tolist()
+        # Box of the callout, updated when the _rect changes
+        self._roundedPath = QPainterPath()
+        # Last callout path with the arrow, along with the anchor position it points to
+        self._arrowPath: Tuple[Tuple[float, float], QPainterPath] = None
+        # Cached bounding rect, reset whenever the geometry changes
+        self._boundingRect: QRectF = None
+        self.setFlag(QGraphicsItem.ItemSendsGeometryChanges, True)
+        self._connectChart(chart)
+
+    def _chartSignals(self, chart: QtCharts.QChart) -> List:
+        """ Signals of the chart emitted when the anchor moves relative to the callout without the
+        callout moving, i.e. when the chart is resized, zoomed or scrolled """
+        signals = [chart.plotAreaChanged]
+        for axis in chart.axes():
+            rangeChanged = getattr(axis, 'rangeChanged', None)
+            if rangeChanged is not None:
+                signals.append(rangeChanged)
+        return signals
+
+    def _connectChart(self, chart: QtCharts.QChart) -> None:
+        for signal in self._chartSignals(chart):
+            signal.connect(self._onChartGeometryChanged)
+
+    def _disconnectChart(self, chart: QtCharts.QChart) -> None:
+        try:
+            for signal in self._chartSignals(chart):
+                signal.disconnect(self._onChartGeometryChanged)
+        except RuntimeError:
+            # Chart or axes already deleted
+            pass
+
+    def _onChartGeometryChanged(self, *_) -> None:
+        self.prepareGeometryChange()
+        self._boundingRect = None
 
     def boundingRect(self):
-        anchor = self.mapFromParent(self._chart.mapToPosition(self._anchor))
-        rect = QRectF()
-        rect.setLeft(min(self._rect.left(), anchor.x()))
-        rect.setRight(max(self._rect.right(), anchor.x()))
-        rect.setTop(min(self._rect.top(), anchor.y()))
-        rect.setBottom(max(self._rect.bottom(), anchor.y()))
-
-        return rect
+        if self._boundingRect is None:
+            anchor = self.mapFromParent(self._chart.mapToPosition(self._anchor))
+            rect = QRectF()
+            rect.setLeft(min(self._rect.left(), anchor.x()))
+            rect.setRight(max(self._rect.right(), anchor.x()))
+            rect.setTop(min(self._rect.top(), anchor.y()))
+            rect.setBottom(max(self._rect.bottom(), anchor.y()))
+            self._boundingRect = rect
+        return QRectF(self._boundingRect)
+
+    def itemChange(self, change: QGraphicsItem.GraphicsItemChange, value):
+        if change == QGraphicsItem.ItemPositionHasChanged:
+            # Anchor position relative to the item changed
+            self._boundingRect = None
+        return super().itemChange(change, value)
 
     def paint(self, painter, option, widget):
-        path = QPainterPath()
-        path.addRoundedRect(self._rect, 5, 5)
+        path = QPainterPath(self._roundedPath)
         anchor = self.mapFromParent(self._chart.mapToPosition(self._anchor))
         if not self._rect.contains(anchor) and not self._anchor.isNull():
-            point1 = QPointF()
-            point2 = QPointF()
-
-            # establish the position of the anchor point in relation to _rect
-            above = anchor.y() <= self._rect.top()
-            aboveCenter = (self._rect.top() < anchor.y() <= self._rect.center().y())
-            belowCenter = (self._rect.center().y() < anchor.y() <= self._rect.bottom())
-            below = anchor.y() > self._rect.bottom()
-
-            onLeft = anchor.x() <= self._rect.left()
-            leftOfCenter = (self._rect.left() < anchor.x() <= self._rect.center().x())
-            rightOfCenter = (self._rect.center().x() < anchor.x() <= self._rect.right())
-            onRight = anchor.x() > self._rect.right()
-
-            # get the nearest _rect corner.
-            x = (onRight + rightOfCenter) * self._rect.width()
-            y = (below + belowCenter) * self._rect.height()
-            cornerCase = ((above and onLeft) or (above and onRight) or
-                          (below and onLeft) or (below and onRight))
-            vertical = abs(anchor.x() - x) > abs(anchor.y() - y)
-
-            x1 = (x + leftOfCenter * 10 - rightOfCenter * 20 + cornerCase *
-                  int(not vertical) * (onLeft * 10 - onRight * 20))
-            y1 = (y + aboveCenter * 10 - belowCenter * 20 + cornerCase *
-                  vertical * (above * 10 - below * 20))
-            point1.setX(x1)
-            point1.setY(y1)
-
-            x2 = (x + leftOfCenter * 20 - rightOfCenter * 10 + cornerCase *
-                  int(not vertical) * (onLeft * 20 - onRight * 10))
-            y2 = (y + aboveCenter * 20 - belowCenter * 10 + cornerCase *
-                  vertical * (above * 20 - below * 10))
-            point2.setX(x2)
-            point2.setY(y2)
-
-            path.moveTo(point1)
-            path.lineTo(anchor)
-            path.lineTo(point2)
-            path = path.simplified()
+            ax: float = anchor.x()
+            ay: float = anchor.y()
+            if self._arrowPath is not None and self._arrowPath[0] == (ax, ay):
+                # Anchor did not move since last paint
+                path = self._arrowPath[1]
+            else:
+                x1, y1, x2, y2 = _calloutArrow(self._arrowTable, self._xEdges, self._yEdges, ax, ay)
+                path.moveTo(QPointF(x1, y1))
+                path.lineTo(anchor)
+                path.lineTo(QPointF(x2, y2))
+                # Merging the arrow with the box is expensive, so the result is kept for next paints
+                path = path.simplified()
+                self._arrowPath = ((ax, ay), path)
 
         painter.setBrush(QColor(255, 255, 255))
         painter.drawPath(path)
@@ -118,17 +306,36 @@ class Callout(QGraphicsItem):
 
     def setText(self, text):
         self._text = text
-        metrics = QFontMetrics(self._font)
-        self._textRect = QRectF(metrics.boundingRect(QRect(0, 0, 150, 150), Qt.AlignLeft, self._text))
+        self._textRect = QRectF(self._metrics.boundingRect(QRect(0, 0, 150, 150), Qt.AlignLeft, self._text))
         self._textRect.translate(5, 5)
         self.prepareGeometryChange()
+        self._boundingRect = None
         self._rect = self._textRect.adjusted(-5, -5, 5, 5)
+        self._xEdges = (self._rect.left(), self._rect.center().x(), self._rect.right())
+        self._yEdges = (self._rect.top(), self._rect.center().y(), self._rect.bottom())
+        # Plain lists are faster than arrays when reading single elements
+        self._arrowTable = _calloutArrowTable(self._rect.width(), self._rect.height()).tolist()
+        self._roundedPath = QPainterPath()
+        self._roundedPath.addRoundedRect(self._rect, 5, 5)
+        self._arrowPath = None
+
+    def setChart(self, chart: QtCharts.QChart) -> None:
+        """ Move the callout to another chart, hiding it """
+        self.hide()
+        self._disconnectChart(self._chart)
+        self.setParentItem(chart)
+        self._chart = chart
+        self._connectChart(chart)
+        self._boundingRect = None
 
     def setAnchor(self, point):
+        self.prepareGeometryChange()
         self._anchor = QPointF(point)
+        self._boundingRect = None
 
     def updateGeometry(self):
         self.prepareGeometryChange()
+        self._boundingRect = None
         self.setPos(self._chart.mapToPosition(self._anchor) + QPointF(10, -50))
 
     def __eq__(self, other: 'Callout') -> bool:
@@ -138,24 +345,70 @@ class Callout(QGraphicsItem):
         return not (self == other)
 
 
+def _chartSource(chart: QtCharts.QChart) -> Tuple:
+    """ References to a chart and its series, to tell when a chart copy is outdated. References are
+    kept instead of ids, since ids of deleted charts may be reused by new ones """
+    return (chart, *chart.series())
+
+
+def _isChartSource(source: Tuple, chart: QtCharts.QChart) -> bool:
+    """ True iff 'source' was built with '_chartSource' from the same chart, with the same series """
+    if not source:
+        return False
+    series = chart.series()
+    return len(source) == len(series) + 1 and source[0] is chart and \
+        all(a is b for a, b in zip(source[1:], series))
+
+
+def _openChartWindow(view: QtCharts.QChartView, width: int, height: int) -> 'InteractiveChartWindow':
+    """ Open a window with an interactive copy of the chart shown in 'view' """
+    chartWindow = InteractiveChartWindow(view)  # needs a parent to be kept alive
+    # Open widget with plot
+    chart = copyChart(view.chart())
+    iView = InteractiveChartView(chart=chart, setInWindow=True)
+    iView.enableKeySequences(False)
+    iView.setRenderHints(view.renderHints())
+    chartWindow.setAttribute(Qt.WA_DeleteOnClose, True)
+    chartWindow.setCentralWidget(iView)  # window takes ownership of view
+    chartWindow.resize(width, height)
+    chartWindow.show()
+    return chartWindow
+
+
 class SimpleChartView(QtCharts.QChartView):
     """ A basic ChartView with no interaction that reacts to double clicks """
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Window showing a copy of the chart, if it is still open, with the source of the copied chart
+        self._chartWindow: Tuple[Tuple, InteractiveChartWindow] = (None, None)
+
+    def setChart(self, chart: QtCharts.QChart) -> None:
+        super().setChart(chart)
+        # The open window shows the previous chart
+        self._forgetChartWindow()
+
     def mouseDoubleClickEvent(self, event: QMouseEvent) -> None:
         if event.button() == Qt.LeftButton:
-            chartWindow = InteractiveChartWindow(self)  # needs a parent to be kept alive
-            # Open widget with plot
-            chart = copyChart(self.chart())
-            iView = InteractiveChartView(chart=chart, setInWindow=True)
-            iView.enableKeySequences(False)
-            iView.setRenderHints(self.renderHints())
-            chartWindow.setAttribute(Qt.WA_DeleteOnClose, True)
-            chartWindow.setCentralWidget(iView)  # window takes ownership of view
-            chartWindow.resize(500, 500)
-            chartWindow.show()
+            source, window = self._chartWindow
+            if window is not None and _isChartSource(source, self.chart()):
+                # Chart did not change, so show the already copied one
+                window.raise_()
+                window.activateWindow()
+            else:
+                chart: QtCharts.QChart = self.chart()
+                window = _openChartWindow(self, 500, 500)
+                window.destroyed.connect(self._forgetChartWindow)
+                # Charts replaced by panels are deleted, so the window can't be reused anymore
+                chart.destroyed.connect(self._forgetChartWindow)
+                self._chartWindow = (_chartSource(chart), window)
             event.accept()
         super().mouseDoubleClickEvent(event)
 
+    @Slot()
+    def _forgetChartWindow(self) -> None:
+        self._chartWindow = (None, None)
+
 
 class InteractiveChartView(QtCharts.QChartView):
     """ A ChartView which optionally supports value tooltip, mouse position tracker, zoom and pan """
@@ -163,14 +416,31 @@ class InteractiveChartView(QtCharts.QChartView):
     def __init__(self, chart: QtCharts.QChart = None, parent: QWidget = None, setInWindow: bool = False):
         super().__init__(parent)
         self._setInWindow: bool = setInWindow
-        self._coordX: QGraphicsItem = None
-        self._coordY: QGraphicsItem = None
+        self._coordX: QGraphicsSimpleTextItem = None
+        self._coordY: QGraphicsSimpleTextItem = None
+        self._trackerMetrics: QFontMetrics = None  # font metrics of the coordinates tracker
+        self._axisX: QtCharts.QAbstractAxis = None
+        self._axisY: QtCharts.QAbstractAxis = None
+        # Functions to update axis ticks when the view is resized
+        self._xTickUpdater: Callable[[QtCharts.QChart, QSize], None] = _noTickUpdate
+        self._yTickUpdater: Callable[[QtCharts.QChart, QSize], None] = _noTickUpdate
         # self.__callouts: List[Callout] = None # Disabled for now
         self._tooltip: Callout = None
+        self._lastTooltipState: Tuple = None  # arguments of the last tooltip update
+        # Labels of axis values of the current chart { (axis id, axis type, value): label }
+        self._axisTextCache: Dict[Tuple, str] = dict()
         # Internal fields
         self._mousePressEventPos: QPointF = None
+        # Window showing a copy of the chart, if it is still open, with the source of the copied chart
+        self._chartWindow: Tuple[Tuple, InteractiveChartWindow] = (None, None)
         self._panOn: bool = False
         self._chartIsSet: bool = False  # True iff a valid (i.e. non empty) chart is set in this view
+        # Axis and tracker updates are delayed until resizing stops
+        self._pendingSize: QSize = None
+        self._resizeTimer = QTimer(self)
+        self._resizeTimer.setSingleShot(True)
+        self._resizeTimer.setInterval(50)
+        self._resizeTimer.timeout.connect(self._applyPendingResize)
         # Option enable flags
         self._panEnabled: bool = True
         self._zoomEnabled: bool = True
@@ -219,9 +489,21 @@ class InteractiveChartView(QtCharts.QChartView):
             self._chartIsSet = False
         else:
             self._chartIsSet = True
-
+        self._axisX = chart.axisX()
+        self._axisY = chart.axisY()
+        self._xTickUpdater = _tickUpdater(self._axisX)
+        self._yTickUpdater = _tickUpdater(self._axisY)
+        # The open window shows the previous chart
+        self._forgetChartWindow()
+
+        # Cached labels may refer to axes of the previous chart
+        self._axisTextCache.clear()
         # self.__callouts = list()
-        self._tooltip = Callout(chart)
+        if self._tooltip is None:
+            self._tooltip = Callout(chart)
+        else:
+            self._tooltip.setChart(chart)
+        self._lastTooltipState = None
         chart.setAcceptHoverEvents(True)
         for s in series:
             # s.clicked.connect(self.keepCallout)
@@ -232,99 +514,57 @@ class InteractiveChartView(QtCharts.QChartView):
             self._coordX.setText("X: ")
             self._coordY = QGraphicsSimpleTextItem(chart)
             self._coordY.setText("Y: ")
+            # Keep rendered text in a pixmap, since it is redrawn often
+            self._coordX.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+            self._coordY.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+            self._trackerMetrics = QFontMetrics(self._coordX.font())
             self._updateMouseTrackerPosition()  # Show them in the correct place
 
-    @staticmethod
-    def _updateAxisTickCount(chart: QtCharts.QChart, axis: QtCharts.QAbstractAxis,
-                             newSize: QSize) -> None:
-        """ Given an axis and the size of the view, sets the number of ticks to the best value
-        avoiding too many overlapping labels """
-        # Get one label as string and the current number of ticks/labels
-        label: str
-        ticks: int
-        if axis.type() == QtCharts.QAbstractAxis.AxisTypeDateTime:
-            ticks = axis.tickCount()  # current number of dates shown
-            label = axis.min().toString(axis.format())
-        elif axis.type() == QtCharts.QAbstractAxis.AxisTypeBarCategory:
-            ticks = axis.count()  # number of labels
-            label = axis.at(0) if ticks else None
-        elif axis.type() == QtCharts.QAbstractAxis.AxisTypeCategory:
-            ticks = axis.count()  # number of labels
-            labels = axis.categoriesLabels()
-            label = labels[0] if labels else None
-        else:
-            return  # Axis type not supported
-        if not label:
-            # No labels set
-            return
-        # Decide which dimension is relevant for resizing
-        margins = chart.margins()
-        # layoutMargins: (left, top, right, bottom)
-        layoutMargins: Tuple[float, ...] = chart.layout().getContentsMargins()
-        if layoutMargins:
-            layoutMargins = tuple([i if i is not None else 0.0 for i in layoutMargins])
-        offset: int = 0
-        if axis.orientation() == Qt.Horizontal:
-            if margins:
-                offset += margins.left() + margins.right()
-            if layoutMargins:
-                offset += layoutMargins[0] + layoutMargins[2]
-            # 'length' is the available space for displaying labels, without margins and the space
-            # between every label
-            length = newSize.width() - offset - (ticks * 10)
-        else:
-            if margins:
-                offset += margins.top() + margins.bottom()
-            if layoutMargins:
-                offset += layoutMargins[1] + layoutMargins[3]
-            length = newSize.height() - offset - (ticks * 10)
-        # Compute the optimal width of the label (in pixel)
-        metrics = QFontMetrics(axis.labelsFont())
-        optimalWidth: int = metrics.horizontalAdvance(label) * 1.9  # not precise, 1.9 is to fix it
-
-        # Deal with every type separately
-        if axis.type() == QtCharts.QAbstractAxis.AxisTypeDateTime:
-            # Determine optimal number of ticks to avoid much overlapping
-            newTicks = int(length / optimalWidth) - 1
-            axis.setTickCount(newTicks)
-        elif axis.type() == QtCharts.QAbstractAxis.AxisTypeCategory or axis.type() == \
-                QtCharts.QAbstractAxis.AxisTypeBarCategory:
-            labelSpace: float = length / (ticks * 2)
-            if labelSpace < optimalWidth:
-                deg = min([90, np.degrees(np.arccos(labelSpace / optimalWidth) * 1.1)])
-                axis.setLabelsAngle(deg)
-            else:
-                axis.setLabelsAngle(0)
+    def _axisValueText(self, axis: QtCharts.QAbstractAxis, value: float) -> str:
+        """ Cached version of 'computeAxisValue' for the axes of the current chart """
+        key = (id(axis), axis.type() if axis else None, value)
+        text: str = self._axisTextCache.get(key, None)
+        if text is None:
+            if len(self._axisTextCache) >= _AXIS_TEXT_CACHE_SIZE:
+                self._axisTextCache.clear()
+            text = computeAxisValue(axis, value)
+            self._axisTextCache[key] = text
+        return text
 
     def setBestTickCount(self, newSize: QSize) -> None:
         if self._chartIsSet:
-            xAxis = self.chart().axisX()
-            yAxis = self.chart().axisY()
-            if xAxis:
-                self._updateAxisTickCount(self.chart(), xAxis, newSize)
-            if yAxis:
-                self._updateAxisTickCount(self.chart(), yAxis, newSize)
+            chart = self.chart()
+            self._xTickUpdater(chart, newSize)
+            self._yTickUpdater(chart, newSize)
 
     def _updateMouseTrackerPosition(self, xOffset: int = 50, yOffset: int = 20) -> None:
         if self._chartIsSet and self._positionTrackerEnabled:
             # Update coordinates tracker position
-            self._coordX.setPos(
-                self.chart().size().width() / 2 - xOffset,
-                self.chart().size().height() - yOffset)
-            self._coordY.setPos(
-                self.chart().size().width() / 2 + xOffset,
-                self.chart().size().height() - yOffset)
+            size = self.chart().size()
+            xCenter: float = size.width() / 2
+            y: float = size.height() - yOffset
+            self._coordX.setPos(xCenter - xOffset, y)
+            self._coordY.setPos(xCenter + xOffset, y)
 
     def resizeEvent(self, event: QResizeEvent):
         if self.scene() and self._chartIsSet:
             self.scene().setSceneRect(QRectF(QPointF(0, 0), event.size()))
             self.chart().resize(event.size())
-            # Update axis
-            self.setBestTickCount(event.size())
-            # Update coordinates tracker position (if tracker is active)
-            self._updateMouseTrackerPosition()
+            # Axis and tracker are updated when resize events stop
+            self._pendingSize = event.size()
+            self._resizeTimer.start()
         super().resizeEvent(event)
 
+    @Slot()
+    def _applyPendingResize(self) -> None:
+        if self._pendingSize is None or not self._chartIsSet:
+            return
+        # Update axis
+        self.setBestTickCount(self._pendingSize)
+        # Update coordinates tracker position (if tracker is active)
+        self._updateMouseTrackerPosition()
+        self._pendingSize = None
+
     def mousePressEvent(self, event: QMouseEvent) -> None:
         if self._chartIsSet and self._panEnabled and event.button() == Qt.MiddleButton:
             self._mousePressEventPos = event.pos()
@@ -334,23 +574,23 @@ class InteractiveChartView(QtCharts.QChartView):
 
     def mouseMoveEvent(self, event: QMouseEvent) -> None:
         if self._panEnabled and self._panOn:
-            offset = event.pos() - self._mousePressEventPos
+            pos = event.pos()
+            offset = pos - self._mousePressEventPos
             self.chart().scroll(-offset.x(), offset.y())
-            self._mousePressEventPos = event.pos()
+            self._mousePressEventPos = pos
             event.accept()
         elif self._chartIsSet and self._positionTrackerEnabled:
-            metrics = QFontMetrics(self._coordX.font())
-            xVal = self.chart().mapToValue(event.pos()).x()
-            yVal = self.chart().mapToValue(event.pos()).y()
-            # if self.chart().axisX().type() == QtCharts.QAbstractAxis.AxisTypeDateTime:
-            xText: str = 'X: {}'.format(computeAxisValue(self.chart().axisX(), xVal))
-            yText: str = 'Y: {}'.format(computeAxisValue(self.chart().axisY(), yVal))
-            xSize = metrics.width(xText, -1)
-            ySize = metrics.width(yText, -1)
-            totSize = xSize + ySize
-            self._updateMouseTrackerPosition(xOffset=(totSize // 2))
-            self._coordX.setText(xText)
-            self._coordY.setText(yText)
+            metrics = self._trackerMetrics
+            value: QPointF = self.chart().mapToValue(event.pos())
+            xText: str = 'X: {}'.format(self._axisValueText(self._axisX, value.x()))
+            yText: str = 'Y: {}'.format(self._axisValueText(self._axisY, value.y()))
+            if xText != self._coordX.text() or yText != self._coordY.text():
+                xSize = metrics.width(xText, -1)
+                ySize = metrics.width(yText, -1)
+                totSize = xSize + ySize
+                self._updateMouseTrackerPosition(xOffset=(totSize // 2))
+                self._coordX.setText(xText)
+                self._coordY.setText(yText)
         super().mouseMoveEvent(event)
 
     def mouseReleaseEvent(self, event: QMouseEvent) -> None:
@@ -378,7 +618,10 @@ class InteractiveChartView(QtCharts.QChartView):
     def wheelEvent(self, event: QWheelEvent) -> None:
         if self._chartIsSet and self._zoomEnabled:
             delta: int = event.angleDelta().y()
-            factor = pow(1.25, delta / 240.0)
+            factor = _ZOOM_FACTORS.get(delta)
+            if factor is None:
+                # High resolution wheels or touchpads
+                factor = pow(1.25, delta / 240.0)
             self.chart().zoom(factor)
             event.accept()
 
@@ -401,10 +644,15 @@ class InteractiveChartView(QtCharts.QChartView):
             return
         if not self._tooltip:
             self._tooltip = Callout(self.chart())
+        tooltipState = (state, point.x(), point.y())
+        if tooltipState == self._lastTooltipState:
+            # Same point is still hovered
+            return
+        self._lastTooltipState = tooltipState
         if state:
             self._tooltip.setText('X: {} \nY: {} '
-                                  .format(computeAxisValue(self.chart().axisX(), point.x()),
-                                          computeAxisValue(self.chart().axisY(), point.y())))
+                                  .format(self._axisValueText(self._axisX, point.x()),
+                                          self._axisValueText(self._axisY, point.y())))
             self._tooltip.setAnchor(point)
             self._tooltip.setZValue(11)
             self._tooltip.updateGeometry()
@@ -415,19 +663,25 @@ class InteractiveChartView(QtCharts.QChartView):
     def mouseDoubleClickEvent(self, event: QMouseEvent) -> None:
         if self._chartIsSet and self._openInWindowDoubleClick and not self._setInWindow and \
                 event.button() == Qt.LeftButton:
-            chartWindow = InteractiveChartWindow(self)  # needs a parent to be kept alive
-            # Open widget with plot
-            chart = copyChart(self.chart())
-            iView = InteractiveChartView(chart=chart, setInWindow=True)
-            iView.enableKeySequences(False)
-            iView.setRenderHints(self.renderHints())
-            chartWindow.setAttribute(Qt.WA_DeleteOnClose, True)
-            chartWindow.setCentralWidget(iView)  # window takes ownership of view
-            chartWindow.resize(600, 500)
-            chartWindow.show()
+            source, window = self._chartWindow
+            if window is not None and _isChartSource(source, self.chart()):
+                # Chart did not change, so show the already copied one
+                window.raise_()
+                window.activateWindow()
+            else:
+                chart: QtCharts.QChart = self.chart()
+                window = _openChartWindow(self, 600, 500)
+                window.destroyed.connect(self._forgetChartWindow)
+                # Charts replaced by panels are deleted, so the window can't be reused anymore
+                chart.destroyed.connect(self._forgetChartWindow)
+                self._chartWindow = (_chartSource(chart), window)
             event.accept()
         super().mouseDoubleClickEvent(event)
 
+    @Slot()
+    def _forgetChartWindow(self) -> None:
+        self._chartWindow = (None, None)
+
 
 class BarsInteractiveChartView(InteractiveChartView):
     """ Reimplementation of InteractiveChartView specific for bar charts """
@@ -438,13 +692,16 @@ class BarsInteractiveChartView(InteractiveChartView):
             return
         if not self._tooltip:
             self._tooltip = Callout(self.chart())
+        tooltipState = (status, index, barSet)
+        if tooltipState == self._lastTooltipState:
+            # Same bar is still hovered
+            return
+        self._lastTooltipState = tooltipState
         if status:
-            # Compute chart position
-            pos = QCursor.pos()
-            scenePos = self.mapToScene(self.mapFromGlobal(pos))
-            chartPos = self.chart().mapFromScene(scenePos)
-            pos = self.chart().mapToValue(chartPos, self.chart().series()[0])
-            self._tooltip.setText('N: {:g}'.format((barSet.at(index))))
+            # Anchor the tooltip on top of the bar, which is at the category index
+            value: float = barSet.at(index)
+            pos = QPointF(float(index), value)
+            self._tooltip.setText('N: {:g}'.format(value))
             self._tooltip.setAnchor(pos)
             self._tooltip.setZValue(11)
             self._tooltip.updateGeometry()
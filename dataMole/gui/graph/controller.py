@@ -25,9 +25,11 @@
 # You should have received a copy of the GNU General Public License
 # along with DataMole.  If not, see <https://www.gnu.org/licenses/>.
 
+import functools
 from typing import List, Callable, Dict, Set
 
-from PySide2.QtCore import Slot
+import networkx as nx
+from PySide2.QtCore import Slot, QTimer
 from PySide2.QtWidgets import QWidget, QMessageBox
 
 from dataMole import flow, flogging, gui, exceptions as exp
@@ -35,11 +37,23 @@ from .node import NodeSlot, GraphNode, NodeStatus
 from .scene import GraphScene
 from .view import GraphView
 from ..editor.configuration import configureEditor, configureEditorOptions
+from ..editor.interface import AbsOperationEditor
+from ..widgets.operationmenu import operationInfo
 from ..workbench import WorkbenchModel
 from ...flow.dag import OperationDag
 from ...flow.handler import OperationHandler
 from ...utils import safeDelete
 
+# Names of input slots for nodes with up to 8 inputs
+_INPUT_NAMES: List[List[str]] = [[f'in {i}' for i in range(n)] for n in range(8)]
+
+
+def _inputNames(n: int) -> List[str]:
+    """ Return the names of the input slots of a node with 'n' inputs """
+    if 0 <= n < len(_INPUT_NAMES):
+        return list(_INPUT_NAMES[n])
+    return [f'in {i}' for i in range(n)]
+
 
 class GraphController(QWidget):
     def __init__(self, operation_dag: flow.dag.OperationDag, scene: GraphScene, view: GraphView,
@@ -67,16 +81,17 @@ class GraphController(QWidget):
     def addNode(self, op_class: Callable):
         if self.__executing:
             return
-        op_input: bool = getattr(op_class, 'maxInputNumber')() == 0
-        op_output: bool = getattr(op_class, 'minOutputNumber')() == 0
+        info = operationInfo(op_class)
+        op_input: bool = info.maxInputNumber == 0
+        op_output: bool = info.minOutputNumber == 0
         if op_output or op_input:
             op = op_class(self._workbench_model)
         else:
             op = op_class()
         node = flow.dag.OperationNode(op)
         if self._operation_dag.addNode(node):
-            inputs = ['in {}'.format(i) for i in range(op.maxInputNumber())]
-            self._scene.create_node(name=op.name(), id=node.uid, optionsSet=op.hasOptions(),
+            inputs = _inputNames(info.maxInputNumber)
+            self._scene.create_node(name=info.name, id=node.uid, optionsSet=op.hasOptions(),
                                     inputs=inputs, output=not op_output)
 
     @Slot(NodeSlot, NodeSlot)
@@ -112,9 +127,8 @@ class GraphController(QWidget):
         # Update the scene
         self._scene.delete_selected()
         # Update nodes that were not deleted (but whose edges changed)
-        nodesToUpdate -= set(map(lambda n: n.id, selected_nodes))
-        for nodeId in nodesToUpdate:
-            op = self._operation_dag[nodeId].operation
+        nodesToUpdate.difference_update(n.id for n in selected_nodes)
+        for nodeId, op in self._operation_dag.operations(nodesToUpdate):
             self._scene.updateNodeOptionIndicator(nodeId, op.hasOptions())
 
     @Slot(int)
@@ -126,37 +140,44 @@ class GraphController(QWidget):
         node: flow.dag.OperationNode = self._operation_dag[node_id]
         if not self.__editor_widget:
             flogging.appLogger.debug('Creating new editor')
-            if not node.operation.needsOptions():
+            operation = node.operation
+            if not operation.needsOptions():
                 msg_noeditor = QMessageBox()
-                msg_noeditor.setWindowTitle(node.operation.name())
+                msg_noeditor.setWindowTitle(operation.name())
                 msg_noeditor.setInformativeText(
-                    '{:s}<hr>This operations require no options.'.format(
-                        node.operation.shortDescription()))
+                    '{:s}<hr>This operations require no options.'.format(operation.shortDescription()))
                 msg_noeditor.setStandardButtons(QMessageBox.Ok)
                 msg_noeditor.exec_()
                 msg_noeditor.deleteLater()
                 return
-            # Set up editor
-            self.__editor_widget = node.operation.getEditor()
+            # Set up editor window
+            self.__editor_widget = operation.getEditor()
             self.__editor_node_id = node.uid
-            # Create the central widget and adds options
-            if node.operation.needsOptions():
-                self.__editor_widget.setUpEditor()
-            configureEditor(self.__editor_widget, node.operation, self._view)
-            node.operation.injectEditor(self.__editor_widget)
-            configureEditorOptions(self.__editor_widget, node.operation)
-            # Connect editor signals to slots which handle accept/reject
-            self.__editor_widget.accept.connect(self.onEditAccept)
+            configureEditor(self.__editor_widget, operation, self._view)
             self.__editor_widget.reject.connect(self.cleanupEditor)
-            # Show editor
+            # Show editor immediately and build its content at the next event loop iteration
             self.__editor_widget.move(self._view.rect().center())
             self.__editor_widget.show()
+            QTimer.singleShot(0, functools.partial(self.__finishEditorSetup, self.__editor_widget, node))
         else:
             flogging.appLogger.debug('Editor already opened {}'.format(type(self.__editor_widget)))
             # If an editor is currently opened show it, instead of creating a new one
             self.__editor_widget.activateWindow()
             self.__editor_widget.raise_()
 
+    def __finishEditorSetup(self, editor: AbsOperationEditor, node: flow.dag.OperationNode) -> None:
+        """ Add the central widget and the options to the editor opened for 'node' """
+        if self.__editor_widget is not editor:
+            # Editor was closed in the meantime
+            return
+        operation = node.operation
+        # Editors are opened only for operations which need options
+        editor.setUpEditor()
+        operation.injectEditor(editor)
+        configureEditorOptions(editor, operation)
+        # Options can be accepted only when the editor is ready
+        editor.accept.connect(self.onEditAccept)
+
     @Slot()
     def onEditAccept(self) -> None:
         options = self.__editor_widget.getOptions()
@@ -177,8 +198,7 @@ class GraphController(QWidget):
                 # At least 1 node has been updated
                 flogging.appLogger.debug('Graph node {} edited'.format(self.__editor_node_id))
                 # Update the view for all the nodes that were updated
-                for nodeId in nodesUpdated:
-                    op = self._operation_dag[nodeId].operation
+                for nodeId, op in self._operation_dag.operations(nodesUpdated):
                     self._scene.updateNodeOptionIndicator(nodeId, op.hasOptions())
             else:
                 # The view does not change if no node was updated
@@ -231,13 +251,19 @@ class GraphController(QWidget):
         if self.__executing:
             return
         for node in self._scene.nodesDict.values():
-            node.status = NodeStatus.NONE
-            node.refresh(refresh_edges=False)
+            if node.status != NodeStatus.NONE:
+                node.status = NodeStatus.NONE
+                node.refresh(refresh_edges=False, repaint=False)
+        # Repaint the scene once for all nodes
+        self._scene.update()
         flogging.appLogger.debug('Reset flow status')
 
     @Slot(int, NodeStatus)
     def onStatusChanged(self, uid: int, status: NodeStatus) -> None:
         node: GraphNode = self._scene.nodesDict[uid]
+        if node.status == status:
+            # Nothing to repaint
+            return
         flogging.appLogger.debug('GraphNode status changed in {} at node {} with id {}'
                                  .format(str(status), node.name, node.id))
         node.status = status
@@ -264,25 +290,23 @@ class GraphController(QWidget):
 
         def addNode(opNode, scene) -> GraphNode:
             op = opNode.operation
-            inputNames = ['in {}'.format(i) for i in range(op.maxInputNumber())]
-            isOutput: bool = op.minOutputNumber() == 0
-            return scene.create_node(name=op.name(), id=opNode.uid, optionsSet=op.hasOptions(),
+            info = operationInfo(type(op))
+            inputNames = _inputNames(info.maxInputNumber)
+            isOutput: bool = info.minOutputNumber == 0
+            return scene.create_node(name=info.name, id=opNode.uid, optionsSet=op.hasOptions(),
                                      inputs=inputNames, output=not isOutput)
 
-        def addEdge(sourceItem, childItem, childNode, scene) -> None:
+        def addEdge(sourceItem, childItem, childNode, sourceId, scene) -> None:
             inputs: Dict[int, int] = childNode.inputOrder
             sourceSlot: NodeSlot = sourceItem.slots[1][0]
-            targetSlot: NodeSlot = childItem.slots[0][inputs[node_id]]
+            targetSlot: NodeSlot = childItem.slots[0][inputs[sourceId]]
             scene.create_edge(sourceSlot, targetSlot)
 
-        # Add all nodes
-        for node_id in graph.nodes:
-            nodeDict[node_id] = addNode(self._operation_dag[node_id], self._scene)
-
-        # Add all edges
-        for node_id in graph.nodes:
-            parNode = nodeDict[node_id]
-            for child_id in graph.successors(node_id):  # direct successors
-                childNode: GraphNode = nodeDict[child_id]
-                childOp = self._operation_dag[child_id]
-                addEdge(parNode, childNode, childOp, self._scene)
+        # Add nodes in topological order, so that all parents exist when a node is added with its
+        # incoming edges
+        for node_id in nx.topological_sort(graph):
+            opNode = self._operation_dag[node_id]
+            nodeItem = addNode(opNode, self._scene)
+            nodeDict[node_id] = nodeItem
+            for parent_id in graph.predecessors(node_id):  # direct predecessors
+                addEdge(nodeDict[parent_id], nodeItem, opNode, parent_id, self._scene)
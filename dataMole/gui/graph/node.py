@@ -449,11 +449,14 @@ class GraphNode(QtWidgets.QGraphicsItem):
 
         QtWidgets.QGraphicsItem.mouseMoveEvent(self, event)
 
-    def refresh(self, refresh_edges=True):
+    def refresh(self, refresh_edges=True, repaint=True):
         """Refresh node
 
         :param refresh_edges: If true, also connected edge
         :type refresh_edges: bool
+        :param repaint: If false, the node geometry is updated but no repaint is scheduled, which is
+            useful when the caller repaints the whole scene afterwards
+        :type repaint: bool
 
         """
         self.prepareGeometryChange()
@@ -461,7 +464,8 @@ class GraphNode(QtWidgets.QGraphicsItem):
         if refresh_edges and self.edges:
             for ahash in self.edges:
                 self.scene().edges_by_hash[ahash].refresh()
-        self.update()
+        if repaint:
+            self.update()
 
 
 class NodeSlot(object):
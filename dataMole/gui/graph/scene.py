@@ -28,7 +28,7 @@
 """
 Node graph scene manager based on QGraphicsScene
 """
-from typing import Set, List, Dict
+from typing import Set, List, Dict, Tuple
 
 from PySide2 import QtCore, QtGui, QtWidgets
 from PySide2.QtCore import QPointF
@@ -96,6 +96,12 @@ class GraphScene(QtWidgets.QGraphicsScene):
     def nodesDict(self) -> Dict[int, GraphNode]:
         return self._nodes_by_id
 
+    def nodePositions(self) -> Dict[int, Tuple[float, float]]:
+        """ Return the scene position of every node by id """
+        # Top level nodes are positioned in scene coordinates, so there is no need to map them
+        return {nodeId: (node.scenePos() if node.parentItem() else node.pos()).toTuple()
+                for nodeId, node in self._nodes_by_id.items()}
+
     @property
     def is_interactive_edge(self):
         """Return status of interactive edge mode
@@ -21,10 +21,10 @@
 # You should have received a copy of the GNU General Public License
 # along with DataMole.  If not, see <https://www.gnu.org/licenses/>.
 
-from typing import Dict, Optional, Tuple, Any
+from typing import Dict, Optional, Tuple, Any, List
 
-from PySide2.QtCore import Slot, Qt
-from PySide2.QtWidgets import QWidget, QVBoxLayout, QGridLayout, QLabel, QLayoutItem, QPushButton, \
+from PySide2.QtCore import Slot, Qt, QSignalBlocker
+from PySide2.QtWidgets import QWidget, QVBoxLayout, QGridLayout, QLabel, QPushButton, \
     QSizePolicy, QMessageBox
 
 from dataMole import flogging, gui
@@ -91,38 +91,44 @@ class AttributePanel(QWidget):
             self._statPanel.setStatistics(dict())
             self._histPanel.setData(dict())
             return
-        attType = self._frameModel.headerData(attributeIndex, Qt.Horizontal,
-                                              FrameModel.DataRole)[1]
-        stat: Optional[Dict[str, object]] = self._frameModel.statistics.get(
-            self.__currentAttributeIndex, None)
+        frameModel = self._frameModel
+        histPanel = self._histPanel
+        attType = frameModel.headerData(attributeIndex, Qt.Horizontal, FrameModel.DataRole)[1]
+        stat: Optional[Dict[str, object]] = frameModel.statistics.get(attributeIndex, None)
         if not stat:
             # Ask the model to compute statistics
             self._statPanel.spinner.start()
-            self._frameModel.computeStatistics(attribute=self.__currentAttributeIndex)
+            frameModel.computeStatistics(attribute=attributeIndex)
             flogging.appLogger.debug('Attribute changed and statistics computation started')
         else:
-            self.onComputationFinished(identifier=(self.__currentAttributeIndex, attType, 'stat'))
-        hist: Optional[Dict[Any, int]] = self._frameModel.histogram.get(self.__currentAttributeIndex,
-                                                                        None)
+            self.onComputationFinished(identifier=(attributeIndex, attType, 'stat'))
+        hist: Optional[Dict[Any, int]] = frameModel.histogram.get(attributeIndex, None)
         if not hist:
-            self.recomputeHistogram(self._histPanel.slider.value())
+            self.recomputeHistogram(histPanel.slider.value())
             flogging.appLogger.debug('Attribute changed and histogram computation started')
         else:
-            self.onComputationFinished(identifier=(self.__currentAttributeIndex, attType, 'hist'))
+            self.onComputationFinished(identifier=(attributeIndex, attType, 'hist'))
         # Connect slider if type is numeric
         if attType == Types.Numeric or attType == Types.Datetime:
-            self._histPanel.slider.setEnabled(True)
-            self._histPanel.label.setEnabled(True)
-            self._histPanel.slider.setToolTip('Number of bins')
+            histPanel.slider.setEnabled(True)
+            histPanel.label.setEnabled(True)
+            histPanel.slider.setToolTip('Number of bins')
         else:
-            self._histPanel.slider.setDisabled(True)
-            self._histPanel.label.setDisabled(True)
-            self._histPanel.slider.setToolTip('Bin number is not allowed for non continuous attributes')
+            histPanel.slider.setDisabled(True)
+            histPanel.label.setDisabled(True)
+            histPanel.slider.setToolTip('Bin number is not allowed for non continuous attributes')
 
     @Slot(int)
     def recomputeHistogram(self, bins: int) -> None:
+        attributeIndex = self.__currentAttributeIndex
+        hist: Optional[Dict[Any, int]] = self._frameModel.histogram.get(attributeIndex, None)
+        if hist and len(hist) == bins:
+            # Cached histogram already has the requested number of bins
+            attType = self._frameModel.headerData(attributeIndex, Qt.Horizontal, FrameModel.DataRole)[1]
+            self.onComputationFinished(identifier=(attributeIndex, attType, 'hist'))
+            return
         # Ask the model to compute histogram data
-        self._histPanel.label.setText('Number of bins: {:d}'.format(bins))
+        self._histPanel.label.setText(f'Number of bins: {bins:d}')
         self._histPanel.spinner.start()
         self._frameModel.computeHistogram(attribute=self.__currentAttributeIndex,
                                           histBins=bins)
@@ -144,10 +150,9 @@ class AttributePanel(QWidget):
             self._histPanel.setData(hist, asRanges=(identifier[1] == Types.Numeric or identifier[1] ==
                                                     Types.Datetime))
             # Ensure slider label and value are correctly set
-            self._histPanel.slider.blockSignals(True)
-            self._histPanel.slider.setValue(len(hist))
-            self._histPanel.slider.blockSignals(False)
-            self._histPanel.label.setText('Number of bins: {:d}'.format(len(hist)))
+            with QSignalBlocker(self._histPanel.slider):
+                self._histPanel.slider.setValue(len(hist))
+            self._histPanel.label.setText(f'Number of bins: {len(hist):d}')
             if self._histPanel.chart:
                 self._histPanel.chartView.setBestTickCount(self._histPanel.chart.size())
             flogging.appLogger.debug('Histogram data set')
@@ -194,26 +199,45 @@ class StatisticsPanel(QWidget):
                                         disableParentWhenSpinning=True)
 
         self.spinner.setInnerRadius(15)
-        self.layout = QGridLayout()
-        self.layout.setHorizontalSpacing(2)
-        self.layout.setVerticalSpacing(4)
+        # Statistics are shown in an inner widget, which is replaced every time they change
+        self._inner: QWidget = QWidget(self)
+        # Names of the statistics currently shown and labels with their values
+        self._keys: Tuple[str, ...] = tuple()
+        self._valueLabels: List[QLabel] = list()
+        self.layout = QVBoxLayout()
+        self.layout.setContentsMargins(0, 0, 0, 0)
+        self.layout.addWidget(self._inner)
         self.setLayout(self.layout)
 
     def setStatistics(self, stat: Dict[str, object]) -> None:
-        item: QLayoutItem = self.layout.takeAt(0)
-        while item:
-            item.widget().deleteLater()
-            self.layout.removeItem(item)
-            item = self.layout.takeAt(0)
+        keys: Tuple[str, ...] = tuple(stat.keys())
+        if keys == self._keys:
+            # Same statistics are shown, so only values must be updated
+            for label, v in zip(self._valueLabels, stat.values()):
+                label.setText(str(v))
+            return
+        self._keys = keys
+        self._valueLabels = list()
+        # Delete all the old labels at once, with their container
+        inner = QWidget(self)
+        self.layout.replaceWidget(self._inner, inner)
+        self._inner.deleteLater()
+        self._inner = inner
+        grid = QGridLayout(inner)
+        grid.setHorizontalSpacing(2)
+        grid.setVerticalSpacing(4)
         r: int = 0
         c: int = 0
         for k, v in stat.items():
-            self.layout.addWidget(QLabel('{}:'.format(k), self), r, c, 1, 1,
-                                  alignment=Qt.AlignLeft)
-            self.layout.addWidget(QLabel('{}'.format(str(v)), self), r, c + 1, 1, 1,
-                                  alignment=Qt.AlignLeft)
+            grid.addWidget(QLabel(f'{k}:', inner), r, c, 1, 1, alignment=Qt.AlignLeft)
+            valueLabel = QLabel(str(v), inner)
+            self._valueLabels.append(valueLabel)
+            grid.addWidget(valueLabel, r, c + 1, 1, 1, alignment=Qt.AlignLeft)
             r += 1
             if r % StatisticsPanel._MAX_STAT_ROW == 0:
-                self.layout.setColumnMinimumWidth(c + 2, 5)  # separator
+                grid.setColumnMinimumWidth(c + 2, 5)  # separator
                 c += 3
                 r = 0
+        inner.show()
+        # Keep the spinner above the new widget
+        self.spinner.raise_()
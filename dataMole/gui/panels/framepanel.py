@@ -22,6 +22,7 @@
 # along with DataMole.  If not, see <https://www.gnu.org/licenses/>.
 
 from PySide2.QtCore import Slot, QAbstractItemModel, Qt, Signal
+from PySide2.QtGui import QStandardItem
 from PySide2.QtWidgets import QWidget, QLabel, QFormLayout, QComboBox, QPushButton, \
     QVBoxLayout, QSizePolicy
 
@@ -68,8 +69,12 @@ class FramePanel(QWidget):
 
     @Slot()
     def applyOperation(self) -> None:
-        data: type = self.operationsComboBox.model() \
-            .item(self.operationsComboBox.currentIndex(), 0).data(Qt.UserRole)
+        item: QStandardItem = self.operationsComboBox.model() \
+            .item(self.operationsComboBox.currentIndex(), 0)
+        if item is None:
+            # Operations are loaded after the window is shown, so the list may still be empty
+            return
+        data: type = item.data(Qt.UserRole)
         self.operationRequest.emit(data)
 
     @Slot()
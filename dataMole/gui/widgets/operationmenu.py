@@ -21,10 +21,11 @@
 # You should have received a copy of the GNU General Public License
 # along with DataMole.  If not, see <https://www.gnu.org/licenses/>.
 
+import functools
 import importlib
-from typing import Callable, List
+from typing import Callable, List, NamedTuple, Optional, Iterator, Tuple
 
-from PySide2.QtCore import Qt, QPoint, QMimeData, Slot
+from PySide2.QtCore import Qt, QPoint, QMimeData, Slot, Signal, QTimer
 from PySide2.QtGui import QMouseEvent, QDrag, QStandardItem, QStandardItemModel
 from PySide2.QtWidgets import QWidget, QTreeWidget, QTreeWidgetItem, QApplication
 
@@ -32,6 +33,29 @@ from dataMole.operation import __all_modules__  # contains all modules with oper
 from dataMole.operation.interface.graph import GraphOperation
 
 
+class OperationInfo(NamedTuple):
+    """ Static information about an operation class. Input/output numbers are None for operations
+    which are not GraphOperation """
+    name: str
+    shortDescription: str
+    isGraph: bool
+    minInputNumber: Optional[int]
+    maxInputNumber: Optional[int]
+    minOutputNumber: Optional[int]
+
+
+@functools.lru_cache(maxsize=None)
+def operationInfo(op_class: type) -> OperationInfo:
+    """ Return the static information about an operation class, which is read once and then cached """
+    isGraph: bool = issubclass(op_class, GraphOperation)
+    return OperationInfo(name=op_class.name(),
+                         shortDescription=op_class.shortDescription(),
+                         isGraph=isGraph,
+                         minInputNumber=op_class.minInputNumber() if isGraph else None,
+                         maxInputNumber=op_class.maxInputNumber() if isGraph else None,
+                         minOutputNumber=op_class.minOutputNumber() if isGraph else None)
+
+
 def _build_item(name: str, data: type = None) -> QTreeWidgetItem:
     """
     Build a tree item with a display name, and sets its data
@@ -45,33 +69,37 @@ def _build_item(name: str, data: type = None) -> QTreeWidgetItem:
     if data:
         item.setData(1, Qt.UserRole, data)
         # Show the short description as tooltip of the items
-        if data.shortDescription():
-            item.setData(0, Qt.ToolTipRole, data.shortDescription())
+        shortDescription: str = operationInfo(data).shortDescription
+        if shortDescription:
+            item.setData(0, Qt.ToolTipRole, shortDescription)
         flags |= Qt.ItemIsDragEnabled
     item.setFlags(flags)
     return item
 
 
-def _addChildren(parents: List[QTreeWidgetItem], op_class: Callable) -> None:
-    op_name = getattr(op_class, 'name')()
-    if issubclass(op_class, GraphOperation):
-        op_input: bool = getattr(op_class, 'maxInputNumber')() == 0
-        op_output: bool = getattr(op_class, 'minOutputNumber')() == 0
-        if op_input:
-            parents[0].addChild(_build_item(op_name, data=op_class))
-        elif op_output:
-            parents[1].addChild(_build_item(op_name, data=op_class))
-        else:
-            parents[2].addChild(_build_item(op_name, data=op_class))
-    else:
-        # If it's an Operation then child is added normally but hidden, since only GraphOperations
-        # should be shown
-        item = _build_item(op_name, data=op_class)
-        parents[2].addChild(item)
-        item.setHidden(True)
+# Index of the parent item (Input, Output, All) of a graph operation, given the
+# value of (isInput << 1) | isOutput
+_CATEGORY = (2, 1, 0, 0)
+
+
+def _categorizedItem(op_class: Callable) -> Tuple[int, QTreeWidgetItem, bool]:
+    """ Build the tree item for an operation class and return it with the index of its parent
+    category and whether it must be hidden """
+    info = operationInfo(op_class)
+    item = _build_item(info.name, data=op_class)
+    if info.isGraph:
+        op_input: bool = info.maxInputNumber == 0
+        op_output: bool = info.minOutputNumber == 0
+        return _CATEGORY[(op_input << 1) | op_output], item, False
+    # If it's an Operation then child is added normally but hidden, since only GraphOperations
+    # should be shown
+    return 2, item, True
 
 
 class OperationMenu(QTreeWidget):
+    # Emitted when all the operations have been added to the menu
+    operationsLoaded = Signal()
+
     def __init__(self, parent: QWidget = None):
         super().__init__(parent)
         self.__dragStartPosition: QPoint = None
@@ -80,31 +108,46 @@ class OperationMenu(QTreeWidget):
         self.setDropIndicatorShown(True)
         self.headerItem().setText(0, 'Operations')
         # Parent items (categories)
-        top_items = list(map(_build_item, ['Input', 'Output', 'All']))
-        self.addTopLevelItems(top_items)
-        # Import everything in operations directory
-        var_export = 'export'
-        for moduleName in __all_modules__:
-            module = importlib.import_module(moduleName)
-            if not hasattr(module, var_export):
-                continue
-            op_class = getattr(module, var_export)
-            if isinstance(op_class, list) or isinstance(op_class, tuple):
-                for c in op_class:
-                    _addChildren(top_items, c)
-            else:
-                _addChildren(top_items, op_class)
+        self.__topItems: List[QTreeWidgetItem] = list(map(_build_item, ['Input', 'Output', 'All']))
+        self.addTopLevelItems(self.__topItems)
 
         self.__expanded: bool = False
         self.header().setDefaultAlignment(Qt.AlignCenter)
         self.header().setSectionsClickable(True)
         self.header().sectionClicked.connect(self.toggleExpansion)
         self.setUniformRowHeights(True)
+        # Operation modules are imported once the event loop starts, to show the window sooner
+        QTimer.singleShot(0, self.__populate)
+
+    @Slot()
+    def __populate(self) -> None:
+        """ Import everything in operations directory and add operations to the menu """
+        top_items = self.__topItems
+        buckets: List[List[QTreeWidgetItem]] = [list() for _ in top_items]
+        hidden: List[QTreeWidgetItem] = list()
+        var_export = 'export'
+        for moduleName in __all_modules__:
+            module = importlib.import_module(moduleName)
+            if not hasattr(module, var_export):
+                continue
+            op_classes = getattr(module, var_export)
+            if not isinstance(op_classes, (list, tuple)):
+                op_classes = (op_classes,)
+            for c in op_classes:
+                category, item, isHidden = _categorizedItem(c)
+                buckets[category].append(item)
+                if isHidden:
+                    hidden.append(item)
+        # Insert all children of a category at once
+        for parent, children in zip(top_items, buckets):
+            parent.addChildren(children)
+        # Items can be hidden only after being inserted in the tree
+        for item in hidden:
+            item.setHidden(True)
         self.sortItems(0, Qt.SortOrder.AscendingOrder)
+        self.operationsLoaded.emit()
 
     def model(self) -> QStandardItemModel:
-        items: List[QTreeWidgetItem] = \
-            self.findItems('*', Qt.MatchWrap | Qt.MatchWildcard | Qt.MatchRecursive)
         model = QStandardItemModel()
 
         def standardItem(w: QTreeWidgetItem) -> QStandardItem:
@@ -117,18 +160,26 @@ class OperationMenu(QTreeWidget):
         def filterItems(item: QTreeWidgetItem) -> bool:
             op_class: type = item.data(1, Qt.UserRole)
             keep: bool = bool(item.parent())
-            if keep and issubclass(op_class, GraphOperation):
-                keep &= op_class.minInputNumber() == op_class.maxInputNumber() == 1 \
-                        and op_class.minOutputNumber() == 1
+            info = operationInfo(op_class) if keep else None
+            if keep and info.isGraph:
+                keep &= info.minInputNumber == info.maxInputNumber == 1 and info.minOutputNumber == 1
             else:
                 keep &= item.isHidden()
             return keep
 
-        items = list(map(standardItem, filter(filterItems, items)))
-        for i in items:
-            model.appendRow(i)
+        items = list(map(standardItem, filter(filterItems, self.__iterItems())))
+        model.invisibleRootItem().appendRows(items)
         return model
 
+    def __iterItems(self) -> Iterator[QTreeWidgetItem]:
+        """ Yields every item in the tree in pre-order """
+        stack: List[QTreeWidgetItem] = [self.topLevelItem(i) for i in
+                                        reversed(range(self.topLevelItemCount()))]
+        while stack:
+            item = stack.pop()
+            yield item
+            stack.extend(item.child(j) for j in reversed(range(item.childCount())))
+
     @Slot(int)
     def toggleExpansion(self, section: int) -> None:
         if section == 0:
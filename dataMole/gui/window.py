@@ -27,7 +27,7 @@ import pickle
 from typing import Tuple, Dict
 
 from PySide2 import QtGui
-from PySide2.QtCore import Slot, QThreadPool, Qt, QModelIndex, QUrl, QMutex
+from PySide2.QtCore import Slot, QThreadPool, Qt, QModelIndex, QUrl, QSignalBlocker
 from PySide2.QtGui import QDesktopServices
 from PySide2.QtWidgets import QTabWidget, QWidget, QMainWindow, QMenuBar, QAction, QSplitter, \
     QHBoxLayout, QMenu, QFileDialog, QMessageBox
@@ -45,6 +45,35 @@ from dataMole.gui.workbench import WorkbenchModel, WorkbenchView
 from dataMole.operation.actionwrapper import OperationAction
 from dataMole.operation.readwrite.csv import CsvLoader, CsvWriter
 from dataMole.operation.readwrite.pickle import PickleLoader, PickleWriter
+from dataMole.threads import Worker
+
+
+# Size of the buffer used to read and write flow files
+_FLOW_IO_BUFFER_SIZE = 1 << 20
+
+
+class _FlowReader:
+    """ Reads a pipeline from a pickle file. Meant to be executed by a Worker """
+
+    def __init__(self, path: str):
+        self.path: str = path
+
+    def execute(self) -> Tuple[flow.dag.OperationDag, Dict]:
+        with open(self.path, 'rb', buffering=_FLOW_IO_BUFFER_SIZE) as file:
+            serialization: Dict = pickle.load(file)
+        return flow.dag.OperationDag.deserialize(serialization), serialization
+
+
+class _FlowWriter:
+    """ Writes a serialized pipeline to a pickle file. Meant to be executed by a Worker """
+
+    def __init__(self, path: str, serialization: Dict):
+        self.path: str = path
+        self.serialization: Dict = serialization
+
+    def execute(self) -> None:
+        with open(self.path, 'wb', buffering=_FLOW_IO_BUFFER_SIZE) as file:
+            pickle.dump(self.serialization, file, protocol=pickle.HIGHEST_PROTOCOL)
 
 
 class MainWidget(QWidget):
@@ -56,6 +85,7 @@ class MainWidget(QWidget):
         self.frameInfoPanel = FramePanel(parent=self,
                                          w=self.workbenchModel,
                                          opModel=self.operationMenu.model())
+        self.operationMenu.operationsLoaded.connect(self.onOperationsLoaded)
         self.workbenchView = WorkbenchView()
         self.workbenchView.setModel(self.workbenchModel)
         self.workbenchModel.emptyRowInserted.connect(self.workbenchView.startEditNoSelection)
@@ -63,16 +93,18 @@ class MainWidget(QWidget):
         tabs = QTabWidget(self)
 
         attributeTab = AttributePanel(self.workbenchModel, self)
-        chartsTab = ViewPanel(self.workbenchModel, self)
+        # Visualisation panel is created the first time its tab is shown
+        self.__chartsTab: ViewPanel = None
         self.graphScene = GraphScene(self)
         self._flowView = GraphView(self.graphScene, self)
         self.controller = GraphController(self.graph, self.graphScene, self._flowView,
                                           self.workbenchModel, self)
 
         tabs.addTab(attributeTab, '&Attribute')
-        tabs.addTab(chartsTab, '&Visualise')
+        tabs.addTab(QWidget(self), '&Visualise')
         tabs.addTab(self._flowView, 'F&low')
         self.__curr_tab = tabs.currentIndex()
+        self.__tabs = tabs
 
         self.__leftSide = QSplitter(Qt.Vertical)
         self.__leftSide.addWidget(self.frameInfoPanel)
@@ -89,13 +121,35 @@ class MainWidget(QWidget):
 
         tabs.currentChanged.connect(self.changeTabsContext)
         self.workbenchView.selectedRowChanged[str, str].connect(attributeTab.onFrameSelectionChanged)
-        self.workbenchView.selectedRowChanged[str, str].connect(chartsTab.onFrameSelectionChanged)
         self.workbenchView.selectedRowChanged[str, str].connect(
             self.frameInfoPanel.onFrameSelectionChanged)
         self.workbenchView.rightClick.connect(self.createWorkbenchPopupMenu)
 
+    @Slot()
+    def onOperationsLoaded(self) -> None:
+        # Menu is populated after construction, so the operations list must be updated
+        self.frameInfoPanel.operationsComboBox.setModel(self.operationMenu.model())
+
+    def __createChartsTab(self) -> None:
+        """ Replace the placeholder of the visualisation tab with the real panel """
+        chartsTab = ViewPanel(self.workbenchModel, self)
+        placeholder = self.__tabs.widget(1)
+        with QSignalBlocker(self.__tabs):
+            self.__tabs.removeTab(1)
+            self.__tabs.insertTab(1, chartsTab, '&Visualise')
+            self.__tabs.setCurrentIndex(1)
+        placeholder.deleteLater()
+        self.workbenchView.selectedRowChanged[str, str].connect(chartsTab.onFrameSelectionChanged)
+        # Show the frame which is already selected
+        selection = self.workbenchView.selectedIndexes()
+        if selection:
+            chartsTab.onFrameSelectionChanged(selection[0].data(Qt.DisplayRole), '')
+        self.__chartsTab = chartsTab
+
     @Slot(int)
     def changeTabsContext(self, tab_index: int) -> None:
+        if tab_index == 1 and self.__chartsTab is None:
+            self.__createChartsTab()
         if tab_index == 2:
             self.__leftSide.replaceWidget(0, self.operationMenu)
             self.frameInfoPanel.hide()
@@ -120,10 +174,17 @@ class MainWidget(QWidget):
         csvAction.setOperationArgs(w=self.workbenchModel, frameName=frameName)
         pickleAction.setOperationArgs(w=self.workbenchModel, frameName=frameName)
         deleteAction = QAction('Remove', pMenu)
-        deleteAction.triggered.connect(lambda: self.workbenchModel.removeRow(index.row()))
+        deleteAction.setData(index.row())
+        deleteAction.triggered.connect(self.removeFrame)
         pMenu.addActions([csvAction, pickleAction, deleteAction])
         pMenu.popup(QtGui.QCursor.pos())
 
+    @Slot()
+    def removeFrame(self) -> None:
+        """ Remove the workbench row stored in the triggered action """
+        row: int = self.sender().data()
+        self.workbenchModel.removeRow(row)
+
     def createNewFlow(self, graph: flow.dag.OperationDag) -> None:
         self.graph = graph
         oldScene = self._flowView.scene()
@@ -139,7 +200,10 @@ class MainWidget(QWidget):
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
-        self.__activeCount: int = 0  # number of operations in progress
+        # Number of operations and flow reads/writes in progress. Only changed in the GUI thread
+        self.__activeCount: int = 0
+        # Actions used to run operations requested from the frame panel { operation type: action }
+        self.__actions: Dict[type, OperationAction] = dict()
         centralWidget = MainWidget()
         self.setCentralWidget(centralWidget)
         self.notifier = None  # Set by main script
@@ -149,7 +213,6 @@ class MainWindow(QMainWindow):
         self.setWindowTitle('dataMole')
 
         self.setUpMenus()
-        self.__spinnerMutex = QMutex()
 
         centralWidget.frameInfoPanel.operationRequest.connect(self.executeOperation)
         centralWidget.workbenchView.selectedRowChanged[str, str].connect(self.changedSelectedFrame)
@@ -201,43 +264,44 @@ class MainWindow(QMainWindow):
             logging.error('Operation uid={:d} stopped with errors'.format(uid))
             self.statusBar().showMessage('Operation stopped with errors', 10000)
         elif state == 'start':
-            self.__spinnerMutex.lock()
-            self.__activeCount += 1
-            self.__spinnerMutex.unlock()
-            self.statusBar().startSpinner()
+            self.__taskStarted()
             logging.info('Operation uid={:d} started'.format(uid))
             self.statusBar().showMessage('Executing...', 10000)
         elif state == 'finish':
             logging.info('Operation uid={:d} finished'.format(uid))
-            self.__spinnerMutex.lock()
-            self.__activeCount -= 1
-            if self.__activeCount == 0:
-                self.statusBar().stopSpinner()
-            self.__spinnerMutex.unlock()
+            self.__taskFinished()
         # print('Emit', uid, state, 'count={}'.format(self.__activeCount))
 
+    def __taskStarted(self) -> None:
+        """ Starts the spinner for a new task in progress (an operation or a flow read/write) """
+        self.__activeCount += 1
+        self.statusBar().startSpinner()
+
+    def __taskFinished(self) -> None:
+        """ Stops the spinner if no other task is in progress """
+        self.__activeCount -= 1
+        if self.__activeCount == 0:
+            self.statusBar().stopSpinner()
+
     @Slot(type)
     def executeOperation(self, opType: type) -> None:
-        action = OperationAction(opType, self, opType.name(),
-                                 self.rect().center(), self.centralWidget().workbenchModel)
+        # Actions can run many operations, so one action is kept for every operation type
+        action: OperationAction = self.__actions.get(opType, None)
+        if action is None:
+            action = OperationAction(opType, self, opType.name(),
+                                     self.rect().center(), self.centralWidget().workbenchModel)
+            action.stateChanged.connect(self.operationStateChanged)
+            self.__actions[opType] = action
+        else:
+            # Window may have been moved or resized since the action was created
+            action.setEditorPosition(self.rect().center())
         # Set selected frame in the input combo box of the action
         selection = self.centralWidget().workbenchView.selectedIndexes()
-        if selection:
-            selectedFrame: str = selection[0].data(Qt.DisplayRole)
-            action.setSelectedFrame(selectedFrame)
-        # Delete action when finished
-        action.stateChanged.connect(self.operationStateChanged)
-        action.stateChanged.connect(self.deleteAction)
+        selectedFrame: str = selection[0].data(Qt.DisplayRole) if selection else None
+        action.setSelectedFrame(selectedFrame)
         # Start operation
         action.trigger()
 
-    @Slot(int, str)
-    def deleteAction(self, uid: int, state: str):
-        if state == 'finish':
-            action: QAction = self.sender()
-            action.deleteLater()
-            logging.info('Action for operation uid={:d} scheduled for deletion'.format(uid))
-
     def setUpMenus(self) -> None:
         menuBar = QMenuBar()
         fileMenu = menuBar.addMenu('File')
@@ -320,11 +384,20 @@ class MainWindow(QMainWindow):
             serialization = self.centralWidget().graph.serialize()
             # Add info about scene position to node data
             nodeSerialization: Dict[int, Dict] = serialization['nodes']
+            positions: Dict[int, Tuple[float, float]] = self.centralWidget().graphScene.nodePositions()
             for nodeId, data in nodeSerialization.items():
-                data['pos'] = self.centralWidget().graphScene.nodesDict[nodeId].scenePos().toTuple()
-            with open(path, 'wb') as file:
-                pickle.dump(serialization, file)
-            gui.statusBar.showMessage('Pipeline was successfully exported in {:s}'.format(path), 15)
+                data['pos'] = positions[nodeId]
+            # Write file in a separate thread
+            worker = Worker(_FlowWriter(path, serialization), identifier=path)
+            worker.signals.result.connect(self.onFlowWritten)
+            worker.signals.error.connect(self.onFlowIOError)
+            worker.signals.finished.connect(self.onFlowIOFinished)
+            self.__taskStarted()
+            self.threadPool.start(worker)
+
+    @Slot(object, object)
+    def onFlowWritten(self, path: str, _) -> None:
+        gui.statusBar.showMessage('Pipeline was successfully exported in {:s}'.format(path), 15)
 
     @Slot()
     def readFlow(self):
@@ -332,28 +405,54 @@ class MainWindow(QMainWindow):
         path, ext = QFileDialog.getOpenFileName(self, 'Open flow graph',
                                                 filter='Pickle (*.pickle);;All files (*)')
         if path:
-            try:
-                with open(path, 'rb') as file:
-                    serialization: Dict = pickle.load(file)
-                graph = flow.dag.OperationDag.deserialize(serialization)
-            except pickle.PickleError as e:
-                gui.notifier.addMessage('Pickle error', str(e), QMessageBox.Critical)
-            except exc.DagException as e:
-                gui.notifier.addMessage('Error while creating pipeline', str(e), QMessageBox.Critical)
-            else:
-                # Add the workbench
-                g = graph.getNxGraph()
-                for nodeId in g.nodes:
-                    g.nodes[nodeId]['op'].operation._workbench = self.centralWidget().workbenchModel
-                self.centralWidget().createNewFlow(graph)
-                self.centralWidget().controller.showGraphInScene()
-                # Set position of every node
-                nodeDict = serialization['nodes']
-                for nodeId, node in self.centralWidget().graphScene.nodesDict.items():
-                    pos: Tuple[float, float] = nodeDict[nodeId]['pos']
-                    node.setPos(*pos)
-                    node.refresh()  # Update connected edges
-                # Reconnect actions to the new controller
-                self._aStartFlow.triggered.connect(self.centralWidget().controller.executeFlow)
-                self._aResetFlow.triggered.connect(self.centralWidget().controller.resetFlowStatus)
-                gui.statusBar.showMessage('Pipeline was successfully imported', 15)
+            # Read and deserialize file in a separate thread
+            worker = Worker(_FlowReader(path), identifier=path)
+            worker.signals.result.connect(self.onFlowRead)
+            worker.signals.error.connect(self.onFlowIOError)
+            worker.signals.finished.connect(self.onFlowIOFinished)
+            self.__taskStarted()
+            self.threadPool.start(worker)
+
+    @Slot(object, object)
+    def onFlowRead(self, _: str, result: Tuple[flow.dag.OperationDag, Dict]) -> None:
+        graph, serialization = result
+        # Add the workbench
+        g = graph.getNxGraph()
+        for nodeId in g.nodes:
+            g.nodes[nodeId]['op'].operation._workbench = self.centralWidget().workbenchModel
+        # Actions are reconnected to the new controller later
+        oldController: GraphController = self.centralWidget().controller
+        self._aStartFlow.triggered.disconnect(oldController.executeFlow)
+        self._aResetFlow.triggered.disconnect(oldController.resetFlowStatus)
+        self.centralWidget().createNewFlow(graph)
+        self.centralWidget().controller.showGraphInScene()
+        # Set position of every node
+        nodeDict = serialization['nodes']
+        scene: GraphScene = self.centralWidget().graphScene
+        with QSignalBlocker(scene):
+            for nodeId, node in scene.nodesDict.items():
+                pos: Tuple[float, float] = nodeDict[nodeId]['pos']
+                node.setPos(*pos)
+        # Update every edge once, after all its end nodes have been placed
+        for edge in scene.edges_by_hash.values():
+            edge.refresh()
+        scene.update()
+        # Reconnect actions to the new controller
+        self._aStartFlow.triggered.connect(self.centralWidget().controller.executeFlow)
+        self._aResetFlow.triggered.connect(self.centralWidget().controller.resetFlowStatus)
+        gui.statusBar.showMessage('Pipeline was successfully imported', 15)
+
+    @Slot(object, tuple)
+    def onFlowIOError(self, path: str, error: Tuple[type, Exception, str]) -> None:
+        exctype, value, _ = error
+        if issubclass(exctype, pickle.PickleError):
+            gui.notifier.addMessage('Pickle error', str(value), QMessageBox.Critical)
+        elif issubclass(exctype, exc.DagException):
+            gui.notifier.addMessage('Error while creating pipeline', str(value), QMessageBox.Critical)
+        else:
+            gui.notifier.addMessage('Error while accessing pipeline file',
+                                    '{}: {}'.format(path, str(value)), QMessageBox.Critical)
+
+    @Slot(object)
+    def onFlowIOFinished(self, _: str) -> None:
+        self.__taskFinished()
@@ -72,6 +72,10 @@ class OperationAction(QAction):
         self.__args = args
         self.__kwargs = kwargs
 
+    def setEditorPosition(self, position: QPoint) -> None:
+        """ Set the position of editors opened by the next operations """
+        self.__editorPosition = position
+
     def setSelectedFrame(self, name: str) -> None:
         """
         Set the frame to be used as input in the editor when it is shown. This is only relevant
@@ -81,7 +85,8 @@ class OperationAction(QAction):
         self.__selectedFrame = name
 
     def getResult(self, key: int) -> Any:
-        """ Pops the result of operation with specified key if it exists. Otherwise returns None """
+        """ Pops the result of operation with specified key if it exists. Otherwise returns None.
+        Results are kept only until the 'finish' state of the operation is emitted """
         return self.__results.pop(key, None)
 
     @Slot()
@@ -101,9 +106,10 @@ class OperationAction(QAction):
         if state == 'success':
             self.__results[uid] = sender.result
             sender.result = None
-        # elif state == 'finish':
-        #     sender.editor.deleteLater()  # delete editor (already done)
-        #     sender.deleteLater()  # delete wrapper object
+        elif state == 'finish':
+            # Editor is already deleted by the wrapper. Delete the wrapper too, since actions are
+            # kept alive and reused
+            sender.deleteLater()
         # Log
         if state == 'success' or state == 'error':
             outName = sender.operation.outName if hasattr(sender.operation, 'outName') else None
@@ -112,6 +118,9 @@ class OperationAction(QAction):
                                                 output=outName,
                                                 input=inpName)
         self.stateChanged.emit(uid, state)
+        if state == 'finish':
+            # Results not taken by listeners are dropped, since actions are kept alive and reused
+            self.__results.pop(uid, None)
 
 
 class OperationWrapper(QObject):
@@ -274,6 +283,6 @@ class OperationWrapper(QObject):
             if not outputName or outputName in self.operation.workbench.names:
                 # Change with new name
                 self._outputNameBox.setData(frameName)
-            self.operation._shapes = self.editor.inputShapes = [fr.shape]
+            self.operation.shapes = self.editor.inputShapes = [fr.shape]
             self._inputs = (fr,)
             self.operation.injectEditor(self.editor)
@@ -21,9 +21,12 @@
 # You should have received a copy of the GNU General Public License
 # along with DataMole.  If not, see <https://www.gnu.org/licenses/>.
 
-import re
-from typing import Dict
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Dict, Tuple
 
+import numpy as np
 import pandas as pd
 
 from ..interface.operation import Operation
@@ -31,35 +34,126 @@ from ... import data
 from ...data.types import Types, Type
 
 
+# Bounded cache of column descriptions as {(id(frame), attribute): (weakref(frame), description)}
+_DESCRIBE_CACHE_SIZE = 64
+_describeCache: 'OrderedDict[Tuple[int, int], Tuple[weakref.ref, Dict[str, object]]]' = OrderedDict()
+_describeCacheLock = threading.Lock()
+
+
+def _describeNumeric(col: pd.Series) -> Dict[str, object]:
+    """ Compute the same statistics of 'describe' for a numeric column, with a single selection
+    pass for min, max and quartiles """
+    a: np.ndarray = col.to_numpy(dtype=np.float64, na_value=np.nan)
+    a = a[~np.isnan(a)]
+    n: int = a.size
+    if n == 0:
+        return col.describe().to_dict()
+    mn, q25, q50, q75, mx = np.quantile(a, [0, .25, .5, .75, 1]).tolist()
+    return {'count': float(n), 'mean': float(a.mean()), 'std': float(a.std(ddof=1)) if n > 1 else np.nan,
+            'min': mn, '25%': q25, '50%': q50, '75%': q75, 'max': mx}
+
+
+def _describe(frame: pd.DataFrame, attribute: int) -> Dict[str, object]:
+    """ Return the result of 'describe' for a column, reusing it if the same column of the same
+    dataframe object was already described """
+    key = (id(frame), attribute)
+    with _describeCacheLock:
+        entry = _describeCache.get(key)
+        # Check the frame is still alive, since its id may have been reused
+        if entry is not None and entry[0]() is frame:
+            _describeCache.move_to_end(key)
+            return dict(entry[1])
+    col: pd.Series = frame.iloc[:, attribute]
+    if col.dtype.kind in 'iuf':
+        desc: Dict[str, object] = _describeNumeric(col)
+    else:
+        desc: Dict[str, object] = col.describe().to_dict()
+    with _describeCacheLock:
+        _describeCache[key] = (weakref.ref(frame), desc)
+        if len(_describeCache) > _DESCRIBE_CACHE_SIZE:
+            _describeCache.popitem(last=False)
+    return dict(desc)
+
+
 class AttributeStatistics(Operation):
     def __init__(self):
         super().__init__()
         self.__attribute: int = -1
 
     def execute(self, df: data.Frame) -> Dict[str, object]:
-        desc: Dict[str, object] = df.getRawFrame().iloc[:, self.__attribute].describe().to_dict()
-        # Rename centiles
-        centiles = [(k, v) for k, v in desc.items() if re.fullmatch('.*%', k)]
-        for k, v in centiles:
-            desc['Centile ' + k] = desc.pop(k)
-        # Rename Top and Freq
-        if desc.get('top', None) is not None and desc.get('freq', None) is not None:
-            desc['Most frequent'] = '{} (n={})'.format(desc.pop('top'), desc.pop('freq'))
+        desc: Dict[str, object] = _describe(df.getRawFrame(), self.__attribute)
+        top, freq = desc.get('top', None), desc.get('freq', None)
+        mean, std = desc.get('mean', None), desc.get('std', None)
+        mergeTop: bool = top is not None and freq is not None
+        formatMean: bool = mean is not None and std is not None
+        # Build the renamed statistics in a single pass, keeping the order of the remaining keys
+        stats: Dict[str, object] = dict()
+        centiles: Dict[str, object] = dict()
+        for k, v in desc.items():
+            if k == 'count' or (mergeTop and k in ('top', 'freq')) or (formatMean and k in ('mean', 'std')):
+                continue
+            if k.endswith('%'):
+                centiles['Centile ' + k] = v
+            else:
+                # Uppercase letter
+                stats[k[0].upper() + k[1:]] = v
+        stats.update(centiles)
+        if mergeTop:
+            stats['Most frequent'] = '{} (n={})'.format(top, freq)
         # Add Nan count
         nan_count = df.nRows - int(desc['count'])
-        del desc['count']
-        desc['Nan count'] = '{:d} ({:.2f}%)'.format(nan_count, nan_count / df.nRows * 100)
-        if desc.get('mean', None) is not None and desc.get('std', None) is not None:
-            desc['Mean'] = '{:.3f}'.format(desc.pop('mean'))
-            desc['Std'] = '{:.3f}'.format(desc.pop('std'))
-        # Uppercase letter
-        desc = dict(map(lambda t: (t[0][0].upper() + t[0][1:], t[1]), desc.items()))
-        return desc
+        stats['Nan count'] = '{:d} ({:.2f}%)'.format(nan_count, nan_count / df.nRows * 100)
+        if formatMean:
+            stats['Mean'] = '{:.3f}'.format(mean)
+            stats['Std'] = '{:.3f}'.format(std)
+        return stats
 
     def setOptions(self, attribute: int) -> None:
         self.__attribute: int = attribute
 
 
+def _cutCounts(a: np.ndarray, nBins: int) -> Tuple[np.ndarray, np.ndarray]:
+    """ Count values of a non empty array without nan in 'nBins' equal width bins, computed like
+    'pandas.cut' does. Returns the bounds of every bin and the counts
+
+    :raise ValueError: if the array contains infinite values
+    """
+    mn, mx = a.min(), a.max()
+    if not (np.isfinite(mn) and np.isfinite(mx)):
+        raise ValueError('cannot specify integer `bins` when input data contains infinity')
+    if mn == mx:
+        # Adjust end points before binning
+        mn -= .001 * abs(mn) if mn != 0 else .001
+        mx += .001 * abs(mx) if mx != 0 else .001
+        bins = np.linspace(mn, mx, nBins + 1, endpoint=True)
+    else:
+        # Adjust end points after binning, so that the minimum falls in the first bin
+        bins = np.linspace(mn, mx, nBins + 1, endpoint=True)
+        bins[0] -= (mx - mn) * .001
+    bins = np.unique(bins)
+    # Bins are closed on the right
+    binIndex = np.searchsorted(bins, a, side='left') - 1
+    return bins, np.bincount(binIndex, minlength=bins.size - 1)
+
+
+def _roundFrac(x: float, precision: int) -> float:
+    """ Round a bin bound like 'pandas.cut' does when building interval labels """
+    if not np.isfinite(x) or x == 0:
+        return x
+    frac, whole = np.modf(x)
+    digits = -int(np.floor(np.log10(abs(frac)))) - 1 + precision if whole == 0 else precision
+    return np.around(x, digits)
+
+
+def _inferPrecision(bins: np.ndarray, basePrecision: int = 3) -> int:
+    """ Find the precision used by 'pandas.cut' to round bin bounds, which is the smallest one
+    starting from 'basePrecision' keeping all bounds distinct """
+    for precision in range(basePrecision, 20):
+        if np.unique([_roundFrac(b, precision) for b in bins]).size == bins.size:
+            return precision
+    return basePrecision
+
+
 class Hist(Operation):
     def __init__(self):
         super().__init__()
@@ -69,17 +163,27 @@ class Hist(Operation):
 
     def execute(self, df: data.Frame) -> Dict[object, int]:
         col = df.getRawFrame().iloc[:, self.__attribute]
+        if self.__type == Types.Numeric and col.dtype.kind in 'iuf':
+            a: np.ndarray = col.to_numpy(dtype=np.float64, na_value=np.nan)
+            a = a[~np.isnan(a)]
+            if a.size:
+                bins, counts = _cutCounts(a, self.__nBins)
+                precision = _inferPrecision(bins)
+                left = [_roundFrac(x, precision) for x in bins[:-1].tolist()]
+                labels = np.char.mod('%.2f', left).tolist()
+                return dict(zip(labels, counts.tolist()))
         if self.__type == Types.Numeric or self.__type == Types.Datetime:
             # Differently from value_counts, this handles the case where all values are nan
             cuts = pd.cut(col, bins=self.__nBins, duplicates='drop')
             values = cuts.value_counts(sort=False)
+            # Left bounds of the bins, in the same order of counts
+            left = values.index.categories.take(values.index.codes).left
             if self.__type == Types.Numeric:
-                values.index = values.index.map(lambda i: '{:.2f}'.format(i.left))
+                labels = np.char.mod('%.2f', left.to_numpy()).tolist()
             else:
                 # Datetime
-                fmt = '%Y-%m-%d %H:%M'
-                values.index = values.index.map(lambda i: i.left.strftime(fmt))
-            return values.to_dict()
+                labels = left.strftime('%Y-%m-%d %H:%M').tolist()
+            return dict(zip(labels, values.tolist()))
         else:
             return col.value_counts(sort=False).to_dict()
 
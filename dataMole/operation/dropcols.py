@@ -21,8 +21,9 @@
 # You should have received a copy of the GNU General Public License
 # along with DataMole.  If not, see <https://www.gnu.org/licenses/>.
 
-from typing import List, Dict, Optional
+from typing import Dict, Optional
 
+import numpy as np
 import prettytable as pt
 
 from dataMole import data, exceptions as exp, flogging
@@ -34,19 +35,24 @@ from dataMole.operation.interface.graph import GraphOperation
 class DropColumns(GraphOperation, flogging.Loggable):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        # List of selected attributes by column name
-        self.__selected: List[int] = list()
+        # Sorted positions of the selected attributes
+        self.__selected: np.ndarray = np.empty(0, dtype=np.intp)
 
     def logOptions(self) -> Optional[str]:
         tt = pt.PrettyTable(field_names=['Columns to drop'])
         columns = self.shapes[0].colNames
-        for a in self.__selected:
+        for a in self.__selected.tolist():
             tt.add_row([columns[a]])
         return tt.get_string(border=True, vrules=pt.ALL)
 
     def execute(self, df: data.Frame) -> data.Frame:
         df = df.getRawFrame()
-        return data.Frame(df.drop(columns=df.columns[[self.__selected]]))
+        if self.__selected.size and (self.__selected[0] < 0 or self.__selected[-1] >= df.shape[1]):
+            raise IndexError('Selected column positions {} are out of bounds for {:d} columns'
+                             .format(self.__selected.tolist(), df.shape[1]))
+        # Select columns by position, which is also correct with duplicated column names
+        keep = np.setdiff1d(np.arange(df.shape[1]), self.__selected, assume_unique=True)
+        return data.Frame(df.take(keep, axis=1))
 
     @staticmethod
     def name() -> str:
@@ -55,23 +61,24 @@ class DropColumns(GraphOperation, flogging.Loggable):
     def setOptions(self, selected: Dict[int, None]) -> None:
         if not selected:
             raise exp.OptionValidationError([('e', 'Error: no attribute is selected')])
-        self.__selected = list(selected.keys())
+        self.__selected = np.fromiter(selected.keys(), dtype=np.intp, count=len(selected))
+        self.__selected.sort()
 
     @staticmethod
     def shortDescription() -> str:
         return 'Remove entire columns from dataframe'
 
     def hasOptions(self) -> bool:
-        return bool(self.__selected)
+        return self.__selected.size > 0
 
     def unsetOptions(self) -> None:
-        self.__selected = list()
+        self.__selected = np.empty(0, dtype=np.intp)
 
     def needsOptions(self) -> bool:
         return True
 
     def getOptions(self) -> Dict[str, Dict[int, None]]:
-        return {'selected': {k: None for k in self.__selected}}
+        return {'selected': dict.fromkeys(self.__selected.tolist())}
 
     def getEditor(self) -> AbsOperationEditor:
         factory = OptionsEditorFactory()
@@ -87,8 +94,10 @@ class DropColumns(GraphOperation, flogging.Loggable):
         if not self.hasOptions():
             return None
         s = self.shapes[0].clone()
-        s.colNames = [n for i, n in enumerate(s.colNames) if i not in self.__selected]
-        s.colTypes = [t for i, t in enumerate(s.colTypes) if i not in self.__selected]
+        selected = frozenset(self.__selected.tolist())
+        kept = [(n, t) for i, (n, t) in enumerate(zip(s.colNames, s.colTypes)) if i not in selected]
+        s.colNames = [n for n, _ in kept]
+        s.colTypes = [t for _, t in kept]
         return s
 
     @staticmethod
@@ -21,11 +21,11 @@
 # You should have received a copy of the GNU General Public License
 # along with DataMole.  If not, see <https://www.gnu.org/licenses/>.
 
-from typing import Iterable, List, Union, Dict
+from typing import Iterable, List, Union, Dict, Optional
 
 from dataMole import data, flogging
 from dataMole import exceptions as exp
-from dataMole.data.types import ALL_TYPES, Type, IndexType
+from dataMole.data.types import ALL_TYPES, Type, IndexType, Types
 from dataMole.gui.editor import AbsOperationEditor, OptionsEditorFactory
 from dataMole.gui.mainmodels import FrameModel
 from dataMole.operation.interface.graph import GraphOperation
@@ -75,8 +75,11 @@ class SetIndex(GraphOperation, flogging.Loggable):
         s = self._shapes[0].clone()
         s.index = [s.colNames[i] for i in self.__columns]
         s.indexTypes = [IndexType(s.colTypes[i]) for i in self.__columns]
-        s.colNames = [name for i, name in enumerate(s.colNames) if i not in self.__columns]
-        s.colTypes = [dtype for i, dtype in enumerate(s.colTypes) if i not in self.__columns]
+        selected = frozenset(self.__columns)
+        kept = [(name, dtype) for i, (name, dtype) in enumerate(zip(s.colNames, s.colTypes))
+                if i not in selected]
+        s.colNames = [name for name, _ in kept]
+        s.colTypes = [dtype for _, dtype in kept]
         return s
 
     def getEditor(self) -> AbsOperationEditor:
@@ -112,18 +115,36 @@ class SetIndex(GraphOperation, flogging.Loggable):
 
 class ResetIndex(GraphOperation, flogging.Loggable):
     def execute(self, df: data.Frame) -> data.Frame:
-        f = df.getRawFrame()
-        columns = set(f.columns.to_list())
-        indexNames = set(f.index.names)
-        conflicts = columns & indexNames
+        # Shallow copy, since renaming the index must not modify the input frame
+        f = df.getRawFrame().copy(deep=False)
+        conflicts: List = f.columns.intersection(f.index.names).to_list()
         if conflicts:
             # There are columns named as index columns. Rename index
-            f.index = f.index.set_names([col + '_index' for col in conflicts], level=conflicts if len(
-                indexNames) > 1 else None)
+            f.index = f.index.set_names([col + '_index' for col in conflicts],
+                                        level=conflicts if f.index.nlevels > 1 else None)
         # Reset index adding indexes as columns. Now there cannot be naming conflicts
         f = f.reset_index(drop=False)
         return data.Frame(f)
 
+    def computeOutputShape(self, shapes: List[data.Shape]) -> Optional[data.Shape]:
+        s = shapes[0]
+        if 'Unnamed' in s.index:
+            # Pandas chooses the column name of unnamed levels, so let it do the work
+            return NotImplemented
+        colNames = set(s.colNames)
+        # Index levels become the first columns, renamed if they conflict with existing columns
+        indexNames = [n + '_index' if n in colNames else n for n in s.index]
+        if colNames.intersection(indexNames) or len(set(indexNames)) < len(indexNames):
+            # Some level names still conflict, and executing the operation will fail
+            return NotImplemented
+        out = data.Shape()
+        out.colNames = indexNames + s.colNames
+        out.colTypes = [t.type for t in s.indexTypes] + s.colTypes
+        # New index is the default one
+        out.index = ['Unnamed']
+        out.indexTypes = [IndexType(Types.Numeric)]
+        return out
+
     @staticmethod
     def name() -> str:
         return 'Reset index'
@@ -21,8 +21,10 @@
 # You should have received a copy of the GNU General Public License
 # along with DataMole.  If not, see <https://www.gnu.org/licenses/>.
 
+import threading
 from abc import abstractmethod
-from typing import Union, List, Optional, Iterable
+from collections import OrderedDict
+from typing import Union, List, Optional, Iterable, Dict, Tuple, Hashable
 
 from dataMole import data
 from dataMole.data.types import ALL_TYPES, Type
@@ -30,6 +32,28 @@ from dataMole.gui.editor.interface import AbsOperationEditor
 from dataMole.gui.workbench import WorkbenchModel
 from .operation import Operation
 
+# Bounded cache of dummy frames used to infer output shapes, as {shape fingerprint: frame}
+_DUMMY_FRAME_CACHE_SIZE = 32
+_dummyFrameCache: 'OrderedDict[Tuple, data.Frame]' = OrderedDict()
+_dummyFrameCacheLock = threading.Lock()
+
+
+def _dummyFrame(shape: data.Shape) -> data.Frame:
+    """ Returns a dummy frame with the given shape, reusing the one built for an equal shape. The
+    frame is shared, so it must not be modified """
+    key = (tuple(shape.colNames), tuple(shape.colTypes), tuple(shape.index), tuple(shape.indexTypes))
+    with _dummyFrameCacheLock:
+        frame = _dummyFrameCache.get(key, None)
+        if frame is not None:
+            _dummyFrameCache.move_to_end(key)
+            return frame
+    frame = data.Frame.fromShape(shape)
+    with _dummyFrameCacheLock:
+        _dummyFrameCache[key] = frame
+        if len(_dummyFrameCache) > _DUMMY_FRAME_CACHE_SIZE:
+            _dummyFrameCache.popitem(last=False)
+    return frame
+
 
 class GraphOperation(Operation):
     """
@@ -41,6 +65,10 @@ class GraphOperation(Operation):
         # Holds the input shapes
         super().__init__(w)
         self._shapes: List[Optional[data.Shape]] = [None] * self.maxInputNumber()
+        # Number of input shapes which are not set
+        self._unsetCount: int = len(self._shapes)
+        # Output shapes computed by 'getOutputShape', keyed by input shapes identity and options
+        self._shapeCache: Dict[Tuple[Tuple[int, ...], Hashable], data.Shape] = dict()
 
     # ----------------------------------------------------------------------------
     # ---------------------- FINAL METHODS (PLS NO OVERRIDE) ---------------------
@@ -50,6 +78,13 @@ class GraphOperation(Operation):
     def shapes(self) -> List[Optional[data.Shape]]:
         return self._shapes
 
+    @shapes.setter
+    def shapes(self, shapes: List[Optional[data.Shape]]) -> None:
+        """ Replaces all the input shapes at once """
+        self._shapes = shapes
+        self._unsetCount = shapes.count(None)
+        self._shapeCache.clear()
+
     def addInputShape(self, shape: data.Shape, pos: int) -> None:
         """ Setter method for the shape input
 
@@ -62,7 +97,9 @@ class GraphOperation(Operation):
         """
         if pos < 0:
             raise ValueError('Position must be non-negative')
+        self._unsetCount += (shape is None) - (self._shapes[pos] is None)
         self._shapes[pos] = shape
+        self._shapeCache.clear()
 
     def removeInputShape(self, pos: int) -> None:
         """ Remove the input shape at given position, replacing it with None
@@ -75,7 +112,9 @@ class GraphOperation(Operation):
         """
         if pos < 0:
             raise ValueError('Position must be non-negative')
+        self._unsetCount += self._shapes[pos] is not None
         self._shapes[pos] = None
+        self._shapeCache.clear()
 
     # ---------------------------------------------------------
     # -------------------- VIRTUAL METHODS --------------------
@@ -93,12 +132,45 @@ class GraphOperation(Operation):
         See :func:`~dataMole.operation.interface.GraphOperation.isOutputShapeKnown`
         """
         # If shapes or options are not set
-        if not all(self._shapes) or (self.needsOptions() and not self.hasOptions()):
+        if self._unsetCount > 0 or (self.needsOptions() and not self.hasOptions()):
             return None
-        # Try to execute the operation with dummy frames
-        dummy_frames = map(data.Frame.fromShape, self._shapes)
-        result = self.execute(*dummy_frames)
-        return result.shape
+        fingerprint = self._optionsFingerprint()
+        key = (tuple(map(id, self._shapes)), fingerprint)
+        if fingerprint is not None and key in self._shapeCache:
+            return self._shapeCache[key].clone()
+        # Prefer inferring the shape from input shapes
+        shape = self.computeOutputShape(self._shapes)
+        if shape is NotImplemented:
+            # Try to execute the operation with dummy frames
+            # Dummy frames are shared, so this relies on 'execute' not modifying its inputs, as required
+            dummyFrames = [_dummyFrame(s) for s in self._shapes]
+            shape = self.execute(*dummyFrames).shape
+        if fingerprint is not None and shape is not None:
+            self._shapeCache[key] = shape.clone()
+        return shape
+
+    def _optionsFingerprint(self) -> Optional[Hashable]:
+        """
+        Returns a hashable value identifying the current options, used to reuse shapes computed by the
+        default :func:`~dataMole.operation.interface.GraphOperation.getOutputShape`. If None is
+        returned shapes are never reused. Defaults to an empty tuple when the operation has no options
+        and to None otherwise
+        """
+        return tuple() if not self.needsOptions() else None
+
+    def computeOutputShape(self, shapes: List[data.Shape]) -> Optional[data.Shape]:
+        """
+        Called by the default implementation of
+        :func:`~dataMole.operation.interface.GraphOperation.getOutputShape` when all input shapes and
+        options are set, to compute the output shape directly from the input shapes without executing
+        the operation on dummy frames. Input shapes must not be modified.
+
+        :param shapes: the input shapes, none of which is None
+        :return: the output shape, or NotImplemented to fall back to the execution on dummy frames.
+            Defaults to NotImplemented
+
+        """
+        return NotImplemented
 
     @staticmethod
     def isOutputShapeKnown() -> bool:
@@ -339,7 +411,7 @@ class OutputGraphOperation(GraphOperation):
 
     def getOutputShape(self) -> Union[data.Shape, None]:
         """ Returns the single input shape unchanged or None if input shapes or options are not set """
-        if not all(self._shapes) or (self.needsOptions() and not self.hasOptions()):
+        if self._unsetCount > 0 or (self.needsOptions() and not self.hasOptions()):
             return None
         return self._shapes[0]
 
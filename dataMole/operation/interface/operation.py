@@ -21,13 +21,20 @@
 # You should have received a copy of the GNU General Public License
 # along with DataMole.  If not, see <https://www.gnu.org/licenses/>.
 
+import functools
 from abc import abstractmethod, ABC
-from typing import Any, Iterable, List
+from typing import Any, Iterable, List, Optional
 
 from dataMole import operation
 from dataMole.data.types import ALL_TYPES, Type
 
 
+@functools.lru_cache(maxsize=None)
+def _classDescription(cls: type) -> Optional[str]:
+    """ Returns the long description of an operation class, which never changes once loaded """
+    return operation.descriptions.get(cls.__name__, None)
+
+
 class Operation(ABC):
     """ Base class of every operation. Allows to set up a command giving arguments and executing it
     over a data.Frame """
@@ -100,7 +107,7 @@ class Operation(ABC):
         :return: a string also with html formatting
 
         """
-        return operation.descriptions.get(self.__class__.__name__, None)
+        return _classDescription(type(self))
 
     def hasOptions(self) -> bool:
         """
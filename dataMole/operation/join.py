@@ -22,7 +22,7 @@
 # along with DataMole.  If not, see <https://www.gnu.org/licenses/>.
 
 from enum import Enum, unique
-from typing import List, Tuple, Iterable, Optional
+from typing import List, Tuple, Iterable, Optional, Hashable
 
 import prettytable as pt
 from PySide2.QtCore import Qt, Slot
@@ -167,6 +167,9 @@ class Join(GraphOperation, flogging.Loggable):
     def getOptions(self) -> Tuple[str, str, bool, int, int, JoinType]:
         return self.__lSuffix, self.__rSuffix, self.__onIndex, self.__leftOn, self.__rightOn, self.__type
 
+    def _optionsFingerprint(self) -> Optional[Hashable]:
+        return self.getOptions()
+
     def getEditor(self) -> AbsOperationEditor:
         return _JoinEditor()
 
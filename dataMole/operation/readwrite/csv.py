@@ -21,11 +21,12 @@
 # You should have received a copy of the GNU General Public License
 # along with DataMole.  If not, see <https://www.gnu.org/licenses/>.
 
+import functools
 import os
-from typing import Iterable, List, Dict, Set, Optional
+from typing import Iterable, List, Dict, Set, Optional, Tuple
 
 import pandas as pd
-from PySide2.QtCore import Slot, Qt, Signal, QThread
+from PySide2.QtCore import Slot, Qt, Signal, QThread, QTimer
 from PySide2.QtGui import QIntValidator
 from PySide2.QtWidgets import QVBoxLayout, QHBoxLayout, QCheckBox, QLineEdit, QLabel, QFileDialog, \
     QPushButton, QButtonGroup, QRadioButton, QWidget
@@ -38,6 +39,13 @@ from dataMole.gui.widgets.waitingspinnerwidget import QtWaitingSpinner
 from dataMole.operation.interface.operation import Operation
 
 
+@functools.lru_cache(maxsize=16)
+def _csvHeader(path: str, sep: str, mtime: int) -> Tuple[str, ...]:
+    """ Reads the column names of a CSV file. The modification time is part of the cache key, so
+    modified files are read again """
+    return tuple(pd.read_csv(path, sep=sep, index_col=False, nrows=0).columns)
+
+
 class CsvLoader(Operation):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -53,10 +61,12 @@ class CsvLoader(Operation):
     def execute(self) -> None:
         if not self.hasOptions():
             raise exp.InvalidOptions('Options are not set')
+        # Map the file in memory, so the parser reads it without intermediate buffered copies
         pd_df = pd.read_csv(self.__file, sep=self.__separator,
                             index_col=False,
                             usecols=self.__selectedColumns,
-                            chunksize=self.__splitByRowN)
+                            chunksize=self.__splitByRowN,
+                            memory_map=True)
         if self.__splitByRowN is not None:
             # pd_df is a chunk iterator
             for i, chunk in enumerate(pd_df):
@@ -215,7 +225,9 @@ class CsvWriter(Operation):
         return True
 
 
+@functools.lru_cache(maxsize=32)
 def parseUnicodeStr(s: str) -> str:
+    """ Replaces escape sequences typed by the user (e.g. '\\t') with the characters they stand for """
     return bytes(s, 'utf-8').decode('unicode_escape')
 
 
@@ -302,10 +314,20 @@ class LoadCSVEditor(AbsOperationEditor):
                 layout.addWidget(self.tablePreview)
                 self.setLayout(layout)
 
-                self.filePath.textChanged.connect(self.loadPreview)
-                self.separator.buttonClicked.connect(self.loadPreview)
+                # Wait for the user to stop typing before reading the header
+                self.previewTimer = QTimer(self)
+                self.previewTimer.setSingleShot(True)
+                self.previewTimer.setInterval(250)
+                self.previewTimer.timeout.connect(self.loadPreview)
+                self.filePath.textChanged.connect(self.schedulePreview)
+                self.separator.buttonClicked.connect(self.schedulePreview)
+
+            @Slot()
+            def schedulePreview(self) -> None:
+                """ Restarts the timer which loads the preview """
+                self.previewTimer.start()
 
-            @Slot(object)
+            @Slot()
             def loadPreview(self) -> None:
                 if not os.path.isfile(self.filePath.text()):
                     return
@@ -319,7 +341,8 @@ class LoadCSVEditor(AbsOperationEditor):
                         self.__sep = separ
 
                     def run(self):
-                        header = pd.read_csv(self.__path, sep=self.__sep, index_col=False, nrows=0)
+                        names = _csvHeader(self.__path, self.__sep, os.stat(self.__path).st_mtime_ns)
+                        header = pd.DataFrame(columns=list(names))
                         self.resultReady.emit(Frame(header))
 
                 sep: int = self.separator.checkedId()
@@ -23,6 +23,8 @@
 
 from typing import Iterable, Union, Optional
 
+import numpy as np
+import pandas as pd
 import prettytable as pt
 from PySide2.QtCore import Qt, Slot
 from PySide2.QtWidgets import QWidget, QButtonGroup, QLabel, QRadioButton, QSlider, QVBoxLayout, \
@@ -33,6 +35,14 @@ from dataMole.gui.editor import AbsOperationEditor
 from dataMole.operation.interface.graph import GraphOperation
 
 
+def _nanMask(pf: pd.DataFrame) -> np.ndarray:
+    """ Returns the boolean mask of nan values in the frame, checking them in a single pass over
+    the values when all columns are float """
+    if pf.shape[1] > 0 and all(isinstance(t, np.dtype) and t.kind == 'f' for t in pf.dtypes):
+        return np.isnan(pf.to_numpy())
+    return pf.isnull().to_numpy()
+
+
 class RemoveNanRows(GraphOperation, flogging.Loggable):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -43,7 +53,8 @@ class RemoveNanRows(GraphOperation, flogging.Loggable):
 
     def logOptions(self) -> Optional[str]:
         tt = pt.PrettyTable(field_names=['Option', 'Value'])
-        tt.add_row(['Threshold %', self.__thresholdPercentage if self.__thresholdPercentage else ''])
+        tt.add_row(['Threshold %',
+                    self.__thresholdPercentage if self.__thresholdPercentage is not None else ''])
         tt.add_row(['Threshold abs', self.__thresholdNumber if self.__thresholdNumber else ''])
         tt.align = 'l'
         return tt.get_string(vrules=pt.ALL, border=True)
@@ -53,14 +64,17 @@ class RemoveNanRows(GraphOperation, flogging.Loggable):
         if self.__thresholdPercentage is not None and self.__thresholdNumber is not None:
             raise exp.InvalidOptions(
                 'Can\'t have both threshold set')
-        pf = df.getRawFrame().copy()
-        if self.__thresholdPercentage:
-            # By percentage
-            pf = pf.loc[pf.isnull().mean(axis=1) <= self.__thresholdPercentage]
+        pf = df.getRawFrame()
+        # Number of nan values in every row
+        nanCount: np.ndarray = _nanMask(pf).sum(axis=1)
+        if self.__thresholdPercentage is not None:
+            # By percentage. With no columns the fraction is nan and everything is removed
+            with np.errstate(invalid='ignore'):
+                keep = nanCount / pf.shape[1] <= self.__thresholdPercentage
         else:
             # By nan number
-            pf = pf.loc[pf.isnull().sum(axis=1) <= self.__thresholdNumber]
-        return data.Frame(pf)
+            keep = nanCount <= self.__thresholdNumber
+        return data.Frame(pf.take(np.flatnonzero(keep)))
 
     @staticmethod
     def name() -> str:
@@ -133,7 +147,8 @@ class RemoveNanColumns(GraphOperation, flogging.Loggable):
 
     def logOptions(self) -> Optional[str]:
         tt = pt.PrettyTable(field_names=['Option', 'Value'])
-        tt.add_row(['Threshold %', self.__thresholdPercentage if self.__thresholdPercentage else ''])
+        tt.add_row(['Threshold %',
+                    self.__thresholdPercentage if self.__thresholdPercentage is not None else ''])
         tt.add_row(['Threshold abs', self.__thresholdNumber if self.__thresholdNumber else ''])
         tt.align = 'l'
         return tt.get_string(vrules=pt.ALL, border=True)
@@ -142,14 +157,17 @@ class RemoveNanColumns(GraphOperation, flogging.Loggable):
         # Assume everything to go is set
         if self.__thresholdPercentage is not None and self.__thresholdNumber is not None:
             raise exp.InvalidOptions('Can\'t have both threshold set')
-        pf = df.getRawFrame().copy()
-        if self.__thresholdPercentage:
-            # By percentage
-            pf = pf.loc[:, pf.isnull().mean() <= self.__thresholdPercentage]
+        pf = df.getRawFrame()
+        # Number of nan values in every column
+        nanCount: np.ndarray = _nanMask(pf).sum(axis=0)
+        if self.__thresholdPercentage is not None:
+            # By percentage. With no rows the fraction is nan and everything is removed
+            with np.errstate(invalid='ignore'):
+                keep = nanCount / pf.shape[0] <= self.__thresholdPercentage
         else:
             # By nan number
-            pf = pf.loc[:, pf.isnull().sum() <= self.__thresholdNumber]
-        return data.Frame(pf)
+            keep = nanCount <= self.__thresholdNumber
+        return data.Frame(pf.take(np.flatnonzero(keep), axis=1))
 
     @staticmethod
     def name() -> str:
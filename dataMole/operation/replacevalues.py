@@ -24,6 +24,7 @@
 from typing import Iterable, List, Any, Tuple, Dict, Optional
 
 import numpy as np
+import pandas as pd
 import prettytable as pt
 from PySide2.QtWidgets import QHeaderView
 
@@ -63,6 +64,58 @@ def floatList(values: List, invalid: str) -> List:
     return floatValues
 
 
+def _sameValue(a: Any, b: Any) -> bool:
+    """ Compares two values considering nan values equal """
+    return a == b or (pd.isna(a) and pd.isna(b))
+
+
+def _mergeReplacements(valueLists: List[List], replaceValues: List) -> Optional[Dict]:
+    """
+    Merges many replacements into a single mapping { value: replacement }, which gives the same result
+    of replacing every list of values in order
+
+    :param valueLists: the lists of values to replace
+    :param replaceValues: the value replacing each list
+
+    :return: the mapping, or None if a list contains the replacement of a previous list, since in this
+        case replacements must be done one after the other
+
+    """
+    mapping = dict()
+    replaced = list()
+    hasNan = False
+    for valueList, replaceVal in zip(valueLists, replaceValues):
+        for v in valueList:
+            if any(_sameValue(v, r) for r in replaced):
+                return None
+            # Only the first replacement of a value is relevant
+            if pd.isna(v):
+                if not hasNan:
+                    mapping[v] = replaceVal
+                    hasNan = True
+            else:
+                mapping.setdefault(v, replaceVal)
+        replaced.append(replaceVal)
+    return mapping
+
+
+def _replaceObjects(column: pd.Series, mapping: Dict) -> pd.Series:
+    """ Replaces values of an object column by replacing its distinct values and taking the
+    replacements through the integer codes of every row. The result is always of object type,
+    which is correct since replacements of non numeric columns are either strings or nan """
+    values: np.ndarray = column.to_numpy()
+    codes, uniques = pd.factorize(values)
+    # Last position is reserved for nan values, which have code -1
+    replaced = np.empty(len(uniques) + 1, dtype=object)
+    replaced[:-1] = [mapping.get(u, u) for u in uniques]
+    result: np.ndarray = replaced.take(codes)
+    missing: np.ndarray = codes == -1
+    if missing.any():
+        nanKeys = [k for k in mapping.keys() if pd.isna(k)]
+        result[missing] = mapping[nanKeys[0]] if nanKeys else values[missing]
+    return pd.Series(result, index=column.index, name=column.name, dtype=object)
+
+
 class ReplaceValues(GraphOperation, flogging.Loggable):
     """ Merge values of one attribute into a single value """
     Nan = np.nan
@@ -87,20 +140,27 @@ class ReplaceValues(GraphOperation, flogging.Loggable):
 
     def execute(self, df: data.Frame) -> data.Frame:
         pd_df = df.getRawFrame().copy(True)
-        for c, colOptions in self.__attributes.items():
-            for valueList, replaceVal in zip(*colOptions):
-                if self.__invertedReplace:
-                    valuesToReplace: List = pd_df.iloc[:, c].unique().tolist()
-                    for a in valueList:
-                        try:
-                            valuesToReplace.remove(a)
-                        except ValueError:
-                            pass  # Value not in list (ignore)
-                else:
-                    valuesToReplace = valueList
-                pd_df.iloc[:, c] = pd_df.iloc[:, c].replace(to_replace=valuesToReplace,
-                                                            value=replaceVal,
-                                                            inplace=False)
+        for c, (valueLists, replaceValues) in self.__attributes.items():
+            column = pd_df.iloc[:, c]
+            mapping = None
+            if not self.__invertedReplace and not isinstance(column.dtype, pd.CategoricalDtype):
+                # Categorical columns are excluded since replacing with a mapping may change their type
+                mapping = _mergeReplacements(valueLists, replaceValues)
+            if mapping is not None and column.dtype == object:
+                # Compare distinct strings only, instead of every row
+                column = _replaceObjects(column, mapping)
+            elif mapping is not None:
+                # Every value is replaced in a single pass
+                column = column.replace(to_replace=mapping, inplace=False)
+            else:
+                for valueList, replaceVal in zip(valueLists, replaceValues):
+                    if self.__invertedReplace:
+                        keep = set(valueList)
+                        valuesToReplace: List = [v for v in column.unique().tolist() if v not in keep]
+                    else:
+                        valuesToReplace = valueList
+                    column = column.replace(to_replace=valuesToReplace, value=replaceVal, inplace=False)
+            pd_df.iloc[:, c] = column
         return data.Frame(pd_df)
 
     def getOutputShape(self) -> Optional[data.Shape]:
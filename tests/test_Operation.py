@@ -60,3 +60,107 @@ def test_hasAttributeShape():
 
     del b._shapes
     assert not hasattr(b, '_shapes')
+
+
+class CountingOp(DummyOp):
+    """ Adds a prefix to column names, counting how many times it is executed """
+
+    def __init__(self):
+        super().__init__()
+        self.executions = 0
+        self.prefix = None
+
+    def execute(self, df: Frame) -> Frame:
+        self.executions += 1
+        raw = df.getRawFrame()
+        return Frame(raw.rename(columns=lambda c: self.prefix + c))
+
+    def setOptions(self, prefix: str) -> None:
+        self.prefix = prefix
+
+    def hasOptions(self) -> bool:
+        return self.prefix is not None
+
+    def needsOptions(self) -> bool:
+        return True
+
+    def _optionsFingerprint(self):
+        return self.prefix
+
+
+def test_outputShape_cache():
+    f = Frame({'col1': [1, 2, 3], 'col2': ['q', '2', 'c']})
+    op = CountingOp()
+    op.addInputShape(f.shape, 0)
+    assert op.getOutputShape() is None and not op._shapeCache
+
+    op.setOptions('a_')
+    s = op.getOutputShape()
+    assert s.colNames == ['a_col1', 'a_col2']
+    assert op.executions == 1
+    # Shape is reused and callers get a copy
+    s.colNames[0] = 'changed'
+    assert op.getOutputShape().colNames == ['a_col1', 'a_col2']
+    assert op.executions == 1
+
+    # Changing options gives a new shape
+    op.setOptions('b_')
+    assert op.getOutputShape().colNames == ['b_col1', 'b_col2']
+    assert op.executions == 2
+
+    # Adding and removing shapes clears the cache
+    op.addInputShape(Frame({'x': [1]}).shape, 0)
+    assert not op._shapeCache
+    assert op.getOutputShape().colNames == ['b_x']
+    assert op.executions == 3
+    op.removeInputShape(0)
+    assert not op._shapeCache
+    assert op.getOutputShape() is None
+    assert op.executions == 3
+
+
+def test_outputShape_cache_no_fingerprint():
+    f = Frame({'col1': [1, 2, 3]})
+
+    class UnknownOptionsOp(CountingOp):
+        def _optionsFingerprint(self):
+            return None
+
+    op = UnknownOptionsOp()
+    op.setOptions('a_')
+    op.addInputShape(f.shape, 0)
+    op.getOutputShape()
+    op.getOutputShape()
+    assert op.executions == 2 and not op._shapeCache
+
+
+def test_unsetCount():
+    f = Frame({'col1': [1, 2, 3]})
+
+    class MyOp(DummyOp):
+        @staticmethod
+        def maxInputNumber() -> int:
+            return 2
+
+    op = MyOp()
+    assert op._unsetCount == 2
+    op.addInputShape(f.shape, 0)
+    assert op._unsetCount == 1
+    # Replacing a set shape does not change the count
+    op.addInputShape(f.shape, 0)
+    assert op._unsetCount == 1
+    op.addInputShape(None, 1)
+    assert op._unsetCount == 1
+    op.addInputShape(f.shape, 1)
+    assert op._unsetCount == 0
+    op.removeInputShape(0)
+    op.removeInputShape(0)
+    assert op._unsetCount == 1
+    assert op.getOutputShape() is None
+
+    # Setter recomputes the count
+    op.shapes = [f.shape, f.shape]
+    assert op._unsetCount == 0
+    op.shapes = [None, f.shape]
+    assert op._unsetCount == 1
+    assert op._unsetCount == op.shapes.count(None)
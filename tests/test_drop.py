@@ -50,3 +50,49 @@ def test_drop_columns():
     assert nan_to_None(h.to_dict()) == {
         'col3': ['q', '2', 'c', None, None]
     }
+
+
+def test_drop_columns_out_of_range():
+    g = data.Frame({'col1': [1, 2], 'col2': ['a', 'b']})
+    op = DropColumns()
+    op.addInputShape(g.shape, 0)
+    op.setOptions(selected={0: None, 2: None})
+    with pytest.raises(IndexError):
+        op.execute(g)
+
+
+def test_drop_columns_duplicate_names():
+    df = pd.DataFrame([[1.0, 'a', 3.0], [2.0, 'b', 4.0]], columns=['col1', 'col2', 'col1'])
+    g = data.Frame(df)
+    op = DropColumns()
+    op.addInputShape(g.shape, 0)
+    op.setOptions(selected={0: None})
+
+    h = op.execute(g)
+    # Only the selected column is dropped, not every column with the same name
+    assert h.colnames == ['col2', 'col1']
+    assert h.getRawFrame().iloc[:, 1].tolist() == [3.0, 4.0]
+    assert h.shape == op.getOutputShape()
+
+
+def test_drop_columns_empty():
+    g = data.Frame(pd.DataFrame(columns=['col1', 'col2', 'col3']))
+    op = DropColumns()
+    op.addInputShape(g.shape, 0)
+    op.setOptions(selected={1: None})
+
+    h = op.execute(g)
+    assert h.colnames == ['col1', 'col3']
+    assert h.nRows == 0
+
+
+def test_drop_columns_unsorted():
+    g = data.Frame({'col1': [1, 2], 'col2': ['a', 'b'], 'col3': [3, 4], 'col4': ['c', 'd']})
+    op = DropColumns()
+    op.addInputShape(g.shape, 0)
+    op.setOptions(selected={3: None, 0: None})
+    assert list(op.getOptions()['selected'].keys()) == [0, 3]
+
+    h = op.execute(g)
+    assert h.colnames == ['col2', 'col3']
+    assert h.shape == op.getOutputShape()
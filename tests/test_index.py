@@ -1,9 +1,11 @@
 import pandas as pd
+import pytest
 
 from dataMole import data
 from dataMole.data import Shape
 from dataMole.data.types import Types, IndexType
 from dataMole.operation.index import SetIndex, ResetIndex
+from dataMole.operation.interface.graph import _dummyFrame
 from tests.utilities import isDictDeepCopy
 
 
@@ -167,3 +169,64 @@ def test_set_index_string():
     assert op.getOutputShape() == s
     j = op.execute(h)
     assert j.shape == s
+
+
+def test_reset_index_shared_dummy_frame():
+    # Unnamed level forces the output shape to be computed by executing on a dummy frame
+    s = Shape()
+    s.colNames = ['col1', 'col2']
+    s.colTypes = [Types.Numeric, Types.String]
+    s.index = ['Unnamed', 'col1']
+    s.indexTypes = [IndexType(Types.Numeric), IndexType(Types.String)]
+
+    dummy = _dummyFrame(s)
+    op = ResetIndex()
+    op.addInputShape(s, 0)
+    os = op.getOutputShape()
+    assert os.colNames == ['Unnamed', 'col1_index', 'col1', 'col2']
+    # The cached dummy frame must not be modified by the shape query
+    assert _dummyFrame(s) is dummy
+    assert dummy.shape == s
+    assert dummy.getRawFrame().index.names == ['Unnamed', 'col1']
+
+
+def makeShape(colNames, colTypes, index, indexTypes) -> Shape:
+    s = Shape()
+    s.colNames = colNames
+    s.colTypes = colTypes
+    s.index = index
+    s.indexTypes = [IndexType(t) for t in indexTypes]
+    return s
+
+
+@pytest.mark.parametrize('shape', [
+    # Plain named index
+    makeShape(['col1', 'col2'], [Types.Numeric, Types.String], ['idx'], [Types.Numeric]),
+    # Index named as a column
+    makeShape(['col1', 'col2'], [Types.Numeric, Types.String], ['col2'], [Types.Datetime]),
+    # Multi-level index
+    makeShape(['col1', 'col2'], [Types.Numeric, Types.Nominal], ['l1', 'l2'],
+              [Types.String, Types.Numeric]),
+    # Multi-level index with a level named as a column
+    makeShape(['col1', 'col2'], [Types.Numeric, Types.Nominal], ['l1', 'col1'],
+              [Types.Ordinal, Types.Numeric])
+])
+def test_reset_index_computed_shape(shape):
+    op = ResetIndex()
+    computed = op.computeOutputShape([shape])
+    assert computed is not NotImplemented
+    executed = op.execute(data.Frame.fromShape(shape)).shape
+    assert computed == executed
+    assert computed.colNames == executed.colNames and computed.colTypes == executed.colTypes
+    assert computed.index == executed.index and computed.indexTypes == executed.indexTypes
+
+
+def test_reset_index_computed_shape_collision():
+    # Index 'col1' would be renamed to 'col1_index', which is already a column
+    s = makeShape(['col1', 'col1_index'], [Types.Numeric, Types.String], ['col1'], [Types.Numeric])
+    op = ResetIndex()
+    assert op.computeOutputShape([s]) is NotImplemented
+    op.addInputShape(s, 0)
+    # Falls back to execution, which fails like execution on real data
+    with pytest.raises(ValueError):
+        op.getOutputShape()
@@ -1,8 +1,11 @@
+import warnings
+
 import numpy as np
+import pandas as pd
 
 from dataMole import data
 from dataMole.data.types import Types
-from dataMole.operation.removenan import RemoveNanRows, RemoveNanColumns
+from dataMole.operation.removenan import RemoveNanRows, RemoveNanColumns, _nanMask
 
 
 # Remove rows
@@ -72,6 +75,24 @@ def test_nan_removerows_byperc():
     assert g == f and g.nRows == 5
 
 
+def test_nan_remove_zero_percentage():
+    d = {'col1': [1, 2, 3, np.nan, 10], 'col2': [3, 4, np.nan, np.nan, 5],
+         'col3': ['q', '2', 'c', '4', 'x']}
+    f = data.Frame(d)
+
+    op = RemoveNanRows()
+    op.setOptions(percentage=0.0, number=None)
+    assert op.getOptions() == (0.0, None) and op.hasOptions()
+    g = op.execute(f)
+    # Only rows without nan values are kept
+    assert g.getRawFrame().index.tolist() == [0, 1, 4]
+
+    op = RemoveNanColumns()
+    op.setOptions(percentage=0.0, number=None)
+    assert op.getOptions() == (0.0, None) and op.hasOptions()
+    g = op.execute(f)
+    assert g.colnames == ['col3']
+
 def test_hasOptions():
     op = RemoveNanRows()
     assert op.hasOptions() is False
@@ -150,3 +171,73 @@ def test_remove_column():
     del s.colNames[i]
     s.index = ['col1']
     assert g.shape == s
+
+
+def test_nan_mask():
+    floats = pd.DataFrame({'col1': [1, np.nan, 3, np.nan], 'col2': [np.nan, np.nan, 1, 2]},
+                          dtype=np.float32)
+    mixed = floats.assign(col3=['q', None, 'c', np.nan], col4=pd.Categorical(['a', 'b', None, 'a']))
+    for pf in [floats, mixed, floats.iloc[0:0], pd.DataFrame(index=range(3))]:
+        mask = _nanMask(pf)
+        assert mask.shape == pf.shape
+        assert (mask == pf.isnull().to_numpy()).all()
+
+
+def test_nan_remove_mixed():
+    d = {'col1': [1, np.nan, 3, np.nan], 'col2': [np.nan, np.nan, 1, 2]}
+    floats = data.Frame(d)
+    mixed = data.Frame(dict(d, col3=['q', None, 'c', 'x']))
+
+    op = RemoveNanRows()
+    op.setOptions(percentage=None, number=1)
+    assert op.execute(floats).getRawFrame().index.tolist() == [0, 2, 3]
+    assert op.execute(mixed).getRawFrame().index.tolist() == [0, 2, 3]
+    op.setOptions(percentage=0.5, number=None)
+    assert op.execute(floats).getRawFrame().index.tolist() == [0, 2, 3]
+    assert op.execute(mixed).getRawFrame().index.tolist() == [0, 2, 3]
+
+    op = RemoveNanColumns()
+    op.setOptions(percentage=None, number=1)
+    assert op.execute(floats).colnames == []
+    assert op.execute(mixed).colnames == ['col3']
+
+
+def test_nan_remove_duplicate_names():
+    pf = pd.DataFrame([[1.0, np.nan, np.nan], [2.0, 3.0, np.nan]], columns=['col1', 'col2', 'col1'])
+    f = data.Frame(pf)
+
+    op = RemoveNanColumns()
+    op.setOptions(percentage=0.6, number=None)
+    g = op.execute(f)
+    # Only the column with nan values is removed
+    assert g.colnames == ['col1', 'col2']
+    assert g.getRawFrame().iloc[:, 0].tolist() == [1.0, 2.0]
+    assert g.getRawFrame().iloc[1, 1] == 3.0
+
+    op = RemoveNanRows()
+    op.setOptions(percentage=None, number=1)
+    g = op.execute(f)
+    assert g.colnames == ['col1', 'col2', 'col1']
+    assert g.nRows == 1
+
+
+def test_nan_remove_empty():
+    noColumns = data.Frame(pd.DataFrame(index=range(3)))
+    noRows = data.Frame(pd.DataFrame(columns=['col1', 'col2']))
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        op = RemoveNanRows()
+        op.setOptions(percentage=None, number=0)
+        assert op.execute(noColumns).nRows == 3
+        assert op.execute(noRows).nRows == 0
+        op.setOptions(percentage=0.5, number=None)
+        # With no columns the percentage of nan is not defined, so every row is removed
+        assert op.execute(noColumns).nRows == 0
+        assert op.execute(noRows).nRows == 0
+
+        op = RemoveNanColumns()
+        op.setOptions(percentage=None, number=0)
+        assert op.execute(noRows).colnames == ['col1', 'col2']
+        op.setOptions(percentage=0.5, number=None)
+        assert op.execute(noRows).colnames == []
+        assert op.execute(noColumns).colnames == []
@@ -1,9 +1,12 @@
+from typing import Dict
+
+import numpy as np
 import pandas as pd
 import pytest
 
 from dataMole import data, exceptions as exp
 from dataMole.data.types import Types
-from dataMole.operation.replacevalues import ReplaceValues
+from dataMole.operation.replacevalues import ReplaceValues, _mergeReplacements, _replaceObjects
 from tests.utilities import nan_to_None, isDictDeepCopy
 
 
@@ -245,3 +248,67 @@ def test_merge_index_val():
     assert g.shape == f.shape
     assert nan_to_None(data.Frame(g.getRawFrame()['col2']).to_dict()) == \
            {'col2': ["h", "h", "5", None, None]}
+
+
+def replaceStrings(values, table: Dict, inverted: bool = False) -> pd.Series:
+    f = data.Frame({'col1': [1, 2, 3, 4.0, 10][:len(values)], 'col3': values})
+    op = ReplaceValues()
+    op.addInputShape(f.shape, 0)
+    op.setOptions(table={1: table}, inverted=inverted)
+    g = op.execute(f)
+    assert g.shape == f.shape
+    return g.getRawFrame()['col3']
+
+
+def test_merge_chained():
+    # Second list contains the replacement of the first, so values are replaced in sequence
+    assert _mergeReplacements([['q', '2'], ['c', '-1']], ['-1', 'z']) is None
+    col = replaceStrings(['q', '2', 'c', '4', 'x'], {'values': 'q 2; c -1', 'replace': '-1; z'})
+    assert col.tolist() == ['z', 'z', 'z', '4', 'x']
+
+
+def test_merge_repeated_values():
+    # First replacement of a value wins
+    assert _mergeReplacements([['q', '2'], ['2', 'c']], ['a', 'b']) == {'q': 'a', '2': 'a', 'c': 'b'}
+    col = replaceStrings(['q', '2', 'c', '4', 'x'], {'values': 'q 2; 2 c', 'replace': 'a; b'})
+    assert col.tolist() == ['a', 'a', 'b', '4', 'x']
+
+
+def test_merge_nan_keys_values():
+    col = replaceStrings(['q', None, 'c', '4', None], {'values': 'nan q; c', 'replace': 'x; nan'})
+    assert nan_to_None(col.tolist()) == ['x', 'x', None, '4', 'x']
+    assert col.dtype == object
+
+    mapping = _mergeReplacements([[np.nan], [float('nan'), 'q']], ['a', 'b'])
+    assert len(mapping) == 2 and mapping['q'] == 'b'
+    col = replaceStrings(['q', None, 'c', '4', None], {'values': 'nan; nan q', 'replace': 'a; b'})
+    assert col.tolist() == ['b', 'a', 'c', '4', 'a']
+
+
+def test_merge_string_inverted_many():
+    col = replaceStrings(['q', '2', 'c', '4', 'x'], {'values': 'q 2; q', 'replace': 'a; b'},
+                         inverted=True)
+    assert col.tolist() == ['q', 'b', 'b', 'b', 'b']
+
+
+def test_merge_category_many():
+    f = data.Frame({'col1': [1, 2, 3, 4.0, 10], 'col2': pd.Categorical(['3', '4', '5', '6', '0'])})
+    op = ReplaceValues()
+    op.addInputShape(f.shape, 0)
+    op.setOptions(table={1: {'values': '3; 4', 'replace': 'x; y'}}, inverted=False)
+    g = op.execute(f)
+    assert g.shape == f.shape
+    col = g.getRawFrame()['col2']
+    assert col.dtype.name == 'category'
+    assert col.tolist() == ['x', 'y', '5', '6', '0']
+
+
+def test_replace_objects():
+    col = pd.Series(['a', None, 'b', np.nan, 'c', 'a'], index=[5, 4, 3, 2, 1, 0], name='c', dtype=object)
+    for mapping in [{'a': 'x'}, {'a': 'x', np.nan: 'n'}, {'a': np.nan, 'b': 'a', 'z': 'y'}]:
+        result = _replaceObjects(col, mapping)
+        expected = col.replace(to_replace=mapping)
+        assert nan_to_None(result.tolist()) == nan_to_None(expected.tolist())
+        assert result.index.equals(col.index) and result.name == col.name
+        # Replacements of string columns are strings or nan, so columns stay of object type
+        assert result.dtype == object
@@ -0,0 +1,85 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from dataMole import data
+from dataMole.data.types import Types
+from dataMole.operation.computations.statistics import Hist, _describeNumeric
+
+
+def cutHistogram(col: pd.Series, bins: int):
+    """ Histogram computed with pandas.cut, as Hist did before counting bins with numpy """
+    values = pd.cut(col, bins=bins, duplicates='drop').value_counts(sort=False)
+    left = values.index.categories.take(values.index.codes).left
+    labels = np.char.mod('%.2f', left.to_numpy()).tolist()
+    return dict(zip(labels, values.tolist()))
+
+
+def numericHistogram(values, bins: int):
+    f = data.Frame({'col': values})
+    op = Hist()
+    op.setOptions(attribute=0, attType=Types.Numeric, bins=bins)
+    return op.execute(f), cutHistogram(f.getRawFrame()['col'], bins)
+
+
+@pytest.mark.parametrize('bins', [1, 3, 10, 25])
+def test_hist_random(bins):
+    rng = np.random.default_rng(7)
+    for scale in [1e-5, 1e-2, 1, 1e3, 1e6]:
+        values = rng.normal(size=200) * scale
+        values[rng.random(200) < 0.1] = np.nan
+        result, expected = numericHistogram(values, bins)
+        assert result == expected
+
+
+@pytest.mark.parametrize('value', [-1.55543794, 0, 1e-7, 3, 12345.678])
+@pytest.mark.parametrize('bins', [1, 2, 10, 40])
+def test_hist_constant(value, bins):
+    result, expected = numericHistogram([value] * 48 + [np.nan], bins)
+    assert result == expected
+
+
+def test_hist_near_constant():
+    values = [2.5 + 1e-9 * i for i in range(30)]
+    for bins in [2, 10, 30]:
+        result, expected = numericHistogram(values, bins)
+        assert result == expected
+
+
+def test_hist_integers():
+    result, expected = numericHistogram([1, 2, 2, 3, 3, 3, 10, np.nan], 4)
+    assert result == expected
+    assert sum(result.values()) == 7
+
+
+def test_hist_infinite():
+    f = data.Frame({'col': [1.0, 2.0, np.inf]})
+    op = Hist()
+    op.setOptions(attribute=0, attType=Types.Numeric, bins=5)
+    with pytest.raises(ValueError):
+        op.execute(f)
+
+
+@pytest.mark.parametrize('values', [
+    [1.5, np.nan, -3, 7, 7, 0.25, np.nan, 12],
+    [4, 1, 3, 2],
+    [2.5, np.nan],
+    [np.nan, np.nan]
+])
+def test_describe_numeric(values):
+    col = pd.Series(values, dtype=np.float64)
+    desc = _describeNumeric(col)
+    expected = col.describe().to_dict()
+    assert list(desc.keys()) == list(expected.keys())
+    for k, v in expected.items():
+        assert desc[k] == pytest.approx(v, nan_ok=True)
+
+
+def test_describe_numeric_random():
+    rng = np.random.default_rng(11)
+    values = rng.normal(size=1001) * 1e3
+    values[rng.random(1001) < 0.2] = np.nan
+    col = pd.Series(values)
+    desc = _describeNumeric(col)
+    for k, v in col.describe().to_dict().items():
+        assert desc[k] == pytest.approx(v)